@@ -1,3 +1,4 @@
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands, Interaction, Member
@@ -8,8 +9,7 @@ from .services.team_manager import TeamManager
 from .services.ai_handler import AIHandler
 from .services.scoring_engine import TeamScoringEngine
 from .services.marathon_service import MarathonService
-from .models.team import TeamConfig, TeamError, InvalidTeamError
-from .ui.views import MainPanelView
+from .models.team import TEAM_CONFIG, TeamError, InvalidTeamError
 from .ui.ai_model_selection import AIModelSelectionView
 
 # Import the separated modules
@@ -24,7 +24,7 @@ class TeamsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.db = bot.db
-        self.config = TeamConfig()
+        self.config = TEAM_CONFIG
 
         # --- Singletons (owned by cog) ---
         self.ai_handler = AIHandler(self.db)
@@ -39,7 +39,22 @@ class TeamsCog(commands.Cog):
         self.event_listeners = EventListeners(self.bot, self.db, self.profile_parser, self.team_manager, self.marathon_service, self.panel_manager, self.config, self.permission_manager)
 
         # Add persistent view
-        bot.add_view(MainPanelView(self.team_manager, self.marathon_service, self.panel_manager, self.db))
+        bot.add_view(self.panel_manager.panel_view)
+
+        # Background member-chunking tasks, kept referenced until they finish
+        self._chunk_tasks = set()
+
+    async def cog_load(self):
+        """
+        Requests the full member list for any guild that isn't chunked yet, so team
+        embeds and provisioning resolve members from the cache instead of one HTTP
+        fetch per member. Runs in the background to avoid delaying startup.
+        """
+        for guild in self.bot.guilds:
+            if not guild.chunked:
+                task = asyncio.create_task(guild.chunk(cache=True))
+                self._chunk_tasks.add(task)
+                task.add_done_callback(self._chunk_tasks.discard)
 
     # ========== EVENT LISTENERS ==========
 
@@ -53,6 +68,36 @@ class TeamsCog(commands.Cog):
         """Handles profile parsing via reaction."""
         await self.event_listeners.on_raw_reaction_add(payload)
 
+    # Keep the role/channel name index in step with the guild
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self.event_listeners.on_guild_role_create(role)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.event_listeners.on_guild_role_delete(role)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self.event_listeners.on_guild_role_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self.event_listeners.on_guild_channel_create(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.event_listeners.on_guild_channel_delete(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        self.event_listeners.on_guild_channel_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        await self.event_listeners.on_guild_remove(guild)
+
     # ========== SLASH COMMANDS ==========
 
     @app_commands.command(name="panel", description="Creates the main team management panel.")
@@ -76,8 +121,7 @@ class TeamsCog(commands.Cog):
 
         # Create new panel
         embed = await self.panel_manager.build_teams_embed(interaction.guild_id)
-        view = MainPanelView(self.team_manager, self.marathon_service, self.panel_manager, self.db)
-        msg = await interaction.channel.send(embed=embed, view=view)
+        msg = await interaction.channel.send(embed=embed, view=self.panel_manager.panel_view)
         await self.db.save_team_panel(interaction.guild_id, interaction.channel_id, msg.id)
         await interaction.followup.send("✅ Team management panel created!",ephemeral=True)
 
@@ -203,10 +247,10 @@ class TeamsCog(commands.Cog):
         try:
             # If set_active parameter is provided, update the marathon state
             if set_active is not None:
-                # Update the marathon state in the database
-                success = await self.team_manager.db.set_marathon_state(interaction.guild_id, set_active)
+                # Update the marathon state in the database and read back what was stored
+                stored_state = await self.team_manager.db.set_and_get_marathon_state(interaction.guild_id, set_active)
 
-                if not success:
+                if stored_state != set_active:
                     await interaction.followup.send("❌ Failed to update marathon state.", ephemeral=True)
                     return
 
@@ -1,8 +1,8 @@
 import discord
 import logging
 
-from .ui.views import MainPanelView
 from .profile_parsing import ProfileParser
+from .utils.name_index import peek_index, drop_index
 from config import REACTION_EMOJI
 
 logger = logging.getLogger(__name__)
@@ -27,13 +27,44 @@ class EventListeners:
                 # Refresh panel on startup to ensure views are active
                 panel_data = await self.db.get_team_panel(guild.id)
                 if panel_data:
-                    self.bot.add_view(
-                        MainPanelView(self.team_manager, self.marathon_service, self.panel_manager, self.db),
-                        message_id=panel_data["message_id"]
-                    )
+                    self.bot.add_view(self.panel_manager.panel_view, message_id=panel_data["message_id"])
             except Exception as e:
                 logger.error(f"Error restoring panel view for guild {guild.id}: {e}")
 
+    # ----- Name index maintenance -----
+
+    def on_guild_role_create(self, role: discord.Role):
+        if index := peek_index(role.guild.id):
+            index.role_created(role)
+
+    def on_guild_role_delete(self, role: discord.Role):
+        if index := peek_index(role.guild.id):
+            index.role_deleted(role)
+
+    def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if index := peek_index(after.guild.id):
+            index.role_updated(before, after)
+
+    def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        if index := peek_index(channel.guild.id):
+            index.channel_created(channel)
+
+    def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        if index := peek_index(channel.guild.id):
+            index.channel_deleted(channel)
+
+    def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        if index := peek_index(after.guild.id):
+            index.channel_updated(before, after)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Forgets the guild's name index and drops its settings document from the database."""
+        drop_index(guild.id)
+        try:
+            await self.db.delete_guild_settings(guild.id)
+        except Exception as e:
+            logger.error(f"Error cleaning up settings for removed guild {guild.id}: {e}")
+
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         """Handles profile parsing via reaction."""
         if payload.channel_id != self.config.communication_channel_id or str(payload.emoji) != REACTION_EMOJI:
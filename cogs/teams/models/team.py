@@ -1,16 +1,16 @@
 from dataclasses import dataclass, field
-from typing import Set, List, Dict, Optional
+from typing import FrozenSet, List, Dict, Optional
 import re
 from config import (
   COMMUNICATION_CHANNEL_ID, MODERATOR_ROLES, EXCLUDED_TEAM_ROLES, MAX_TEAM_SIZE, MAX_LEADERS_PER_TEAM
 )
 
-@dataclass
+@dataclass(frozen=True)
 class TeamConfig:
     """Configuration for team management system."""
     communication_channel_id: int = COMMUNICATION_CHANNEL_ID
-    moderator_roles: Set[str] = field(default_factory=lambda: set(MODERATOR_ROLES))
-    excluded_team_roles: Set[str] = field(default_factory=lambda: set(EXCLUDED_TEAM_ROLES))
+    moderator_roles: FrozenSet[str] = frozenset(MODERATOR_ROLES)
+    excluded_team_roles: FrozenSet[str] = frozenset(EXCLUDED_TEAM_ROLES)
     max_team_number: int = 100
     max_team_size: int = MAX_TEAM_SIZE
     max_leaders_per_team = MAX_LEADERS_PER_TEAM
@@ -25,7 +25,10 @@ class TeamConfig:
         if not self.moderator_roles:
             raise ValueError("At least one moderator role must be specified")
 
-@dataclass
+# Shared, read-only configuration instance used by all services
+TEAM_CONFIG = TeamConfig()
+
+@dataclass(slots=True)
 class TeamMember:
     """Represents a member of a team."""
     user_id: str
@@ -58,6 +61,7 @@ class Team:
     channel_name: str
     members: Dict[str, TeamMember]  # user_id -> TeamMember
     _team_number: Optional[int] = None
+    channel_id: Optional[int] = None  # Discord channel ID, once known
 
     @property
     def team_number(self) -> int:
@@ -84,7 +88,7 @@ class Team:
         return (
             bool(self.team_role) and
             bool(self.channel_name) and
-            re.match(TeamConfig().team_name_pattern, self.team_role)
+            re.match(TEAM_CONFIG.team_name_pattern, self.team_role)
         )
 
     def get_leader_count(self) -> int:
@@ -99,6 +103,7 @@ class Team:
             "channel_name": self.channel_name,
             "members": {uid: member.to_dict() for uid, member in self.members.items()},
             "_team_number": self._team_number,
+            "channel_id": self.channel_id,
         }
 
 class TeamError(Exception):
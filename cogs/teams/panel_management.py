@@ -16,6 +16,8 @@ class PanelManager:
         self.db = db
         self.team_manager = team_manager
         self.marathon_service = marathon_service
+        # The main panel buttons carry no per-guild state, so one persistent view serves every panel
+        self.panel_view = MainPanelView(self.team_manager, self.marathon_service, self, self.db)
 
     def _team_sort_key(self, team_name: str) -> int:
         """Extract numeric part from team name for sorting."""
@@ -108,6 +110,9 @@ class PanelManager:
         if not guild:
             return
 
+        # An explicit refresh always reloads teams from the database
+        self.db.invalidate_teams_cache(guild_id)
+
         # Perform data sync before refreshing the panel
         await self.team_manager.sync_database_with_discord(guild)
 
@@ -125,9 +130,7 @@ class PanelManager:
 
             msg = await channel.fetch_message(panel_data["message_id"])
             embed = await self.build_teams_embed(guild_id)
-            view = MainPanelView(self.team_manager, self.marathon_service, self, self.db)
-            await msg.edit(embed=embed, view=view)
-            self.bot.add_view(view, message_id=msg.id)
+            await msg.edit(embed=embed, view=self.panel_view)
             if interaction:
                 await interaction.followup.send("✅ Panel and data refreshed.", ephemeral=True)
         except discord.NotFound:
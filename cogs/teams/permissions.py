@@ -3,7 +3,7 @@ from typing import Union
 from functools import wraps
 import logging
 
-from .models.team import TeamConfig
+from .models.team import TEAM_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +11,7 @@ class PermissionManager:
     """Handles all permission-related functionality for the bot."""
 
     def __init__(self):
-        self.config = TeamConfig()
+        self.config = TEAM_CONFIG
 
     def is_moderator(self, user: Union[Member, User]) -> bool:
         """
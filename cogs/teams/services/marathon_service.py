@@ -1,7 +1,13 @@
+import asyncio
 import discord
 import logging
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from pymongo.errors import PyMongoError
 from ..models.team import Team, TeamMember
+from ..utils.rate_limiter import DiscordRateLimiter
+from ..utils.name_index import find_role, find_text_channel
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +22,8 @@ class MarathonService:
         """
         self.db = db
         self.team_manager = team_manager
+        # One limiter per guild so every role/channel mutation of a marathon shares its pacing
+        self._limiters: Dict[int, DiscordRateLimiter] = defaultdict(DiscordRateLimiter)
 
     async def start_marathon(self, guild: discord.Guild, teams: List[Team]) -> Dict:
         """
@@ -23,23 +31,31 @@ class MarathonService:
         dedicated roles and private channels for them.
         """
         # Check if marathon is already active
-        is_active = await self.cog.db.get_marathon_state(guild.id)
+        is_active = await self.db.get_marathon_state(guild.id)
         if is_active:
             return {"error": "Marathon is already active for this guild"}
 
         report = {"created_roles": [], "created_channels": [], "skipped_teams": []}
+        limiter = self._limiters[guild.id]
 
-        for team in teams:
-            # 1. Validate the team using the public method from TeamManager
-            valid_members, has_leader = await self.cog.team_manager.validator.get_valid_team_members(guild, team.members)
+        # 1. Validate the teams using the public method from TeamManager
+        validations = await asyncio.gather(*(
+            self.team_manager.validator.get_valid_team_members(guild, team.members) for team in teams
+        ))
 
+        ready_teams = []
+        for team, (valid_members, has_leader) in zip(teams, validations):
             if not valid_members or not has_leader:
                 report["skipped_teams"].append(f"{team.team_role} (No valid leader or members)")
                 continue
+            ready_teams.append((team, valid_members))
 
-            # 2. Provision resources using the helper method
-            role, channel = await self._provision_team_resources(guild, team, valid_members)
+        # 2. Provision resources for all teams concurrently, paced by the guild's rate limiter
+        provisioned = await asyncio.gather(*(
+            self._provision_team_resources(guild, team, valid_members, limiter) for team, valid_members in ready_teams
+        ))
 
+        for role, channel in provisioned:
             if role:
                 report["created_roles"].append(role.name)
             if channel:
@@ -47,33 +63,37 @@ class MarathonService:
 
         # Set marathon state to active if any teams were processed successfully
         if report["created_roles"] or report["created_channels"]:
-            await self.cog.db.set_marathon_state(guild.id, True)
+            await self.db.set_marathon_state(guild.id, True)
             report["marathon_state"] = "activated"
 
         return report
 
-    async def end_marathon(self, guild: discord.Guild) -> Dict:
+    async def end_marathon(self, guild: discord.Guild, teams: Optional[List[Team]] = None) -> Dict:
         """
         Handles the logic for ending a marathon. It removes all marathon-related
-        roles from members and deletes the team channels.
+        roles from members and deletes the team channels. Callers that already
+        fetched the guild's teams can pass them in to skip a second lookup.
         """
         # Check if marathon is active
-        is_active = await self.cog.db.get_marathon_state(guild.id)
+        is_active = await self.db.get_marathon_state(guild.id)
         if not is_active:
             return {"error": "No active marathon found for this guild"}
 
         report = {"removed_channels": [], "removed_roles": [], "processed_teams": []}
-        teams = await self.cog.team_manager.get_all_teams(guild.id)
+        if teams is None:
+            teams = await self.team_manager.get_all_teams(guild.id)
 
-        team_leader_role = discord.utils.get(guild.roles, name="Team Leader")
-        team_member_role = discord.utils.get(guild.roles, name="Team Member")
+        team_leader_role = find_role(guild, "Team Leader")
+        team_member_role = find_role(guild, "Team Member")
+        limiter = self._limiters[guild.id]
 
-        for team in teams:
-            # Deprovision resources using the new helper method
-            removed_role, removed_channel = await self._deprovision_team_resources(
-                guild, team, team_leader_role, team_member_role
-            )
+        # Deprovision all teams concurrently, paced by the guild's rate limiter
+        deprovisioned = await asyncio.gather(*(
+            self._deprovision_team_resources(guild, team, team_leader_role, team_member_role, limiter)
+            for team in teams
+        ))
 
+        for team, (removed_role, removed_channel) in zip(teams, deprovisioned):
             report["processed_teams"].append(team.team_role)
             if removed_role:
                 report["removed_roles"].append(removed_role.name)
@@ -81,13 +101,14 @@ class MarathonService:
                 report["removed_channels"].append(removed_channel.name)
 
         # Set marathon state to inactive
-        await self.cog.db.set_marathon_state(guild.id, False)
+        await self.db.set_marathon_state(guild.id, False)
         report["marathon_state"] = "deactivated"
 
         return report
 
     async def _provision_team_resources(
-        self, guild: discord.Guild, team: Team, members: List[Tuple[discord.Member, str]]
+        self, guild: discord.Guild, team: Team, members: List[Tuple[discord.Member, str]],
+        limiter: DiscordRateLimiter
     ) -> Tuple[discord.Role | None, discord.TextChannel | None]:
         """
         Creates a role and a private channel for a single team.
@@ -97,28 +118,40 @@ class MarathonService:
 
         try:
             # Get or create the team-specific role
-            role = discord.utils.get(guild.roles, name=team.team_role)
+            role = find_role(guild, team.team_role)
             if not role:
-                role = await guild.create_role(name=team.team_role, reason=f"Marathon start for {team.team_role}")
+                role = await limiter.run(partial(guild.create_role, name=team.team_role, reason=f"Marathon start for {team.team_role}"))
                 created_role = role
 
             # Assign the role to all valid members
-            for member, _ in members:
-                if role not in member.roles:
-                    await member.add_roles(role, reason="Marathon team assignment")
+            results = await limiter.run_all(
+                partial(member.add_roles, role, reason="Marathon team assignment")
+                for member, _ in members if role not in member.roles
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
 
             # Get or create the private text channel
-            channel = discord.utils.get(guild.text_channels, name=team.channel_name.lower())
+            channel = find_text_channel(guild, team.channel_name.lower())
             if not channel:
                 overwrites = {
                     guild.default_role: discord.PermissionOverwrite(view_channel=False),
                     role: discord.PermissionOverwrite(view_channel=True, send_messages=True)
                 }
-                channel = await guild.create_text_channel(
+                channel = await limiter.run(partial(
+                    guild.create_text_channel,
                     team.channel_name, overwrites=overwrites, reason=f"Marathon channel for {team.team_role}"
-                )
+                ))
                 created_channel = channel
 
+            if team.channel_id != channel.id:
+                # Only an optimisation for later lookups, so a DB failure mustn't abort the marathon start
+                try:
+                    await self.db.update_team_channel_id(guild.id, team.team_role, channel.id)
+                except PyMongoError as e:
+                    logger.error(f"Failed to store channel ID for {team.team_role}: {e}")
+
             return created_role, created_channel
 
         except discord.Forbidden:
@@ -130,35 +163,38 @@ class MarathonService:
 
     async def _deprovision_team_resources(
         self, guild: discord.Guild, team: Team,
-        team_leader_role: discord.Role | None, team_member_role: discord.Role | None
+        team_leader_role: discord.Role | None, team_member_role: discord.Role | None,
+        limiter: DiscordRateLimiter
     ) -> Tuple[discord.Role | None, discord.TextChannel | None]:
         """
         Removes roles from members and deletes the team's channel and role.
         Returns the deleted role and channel, or None if they didn't exist or failed to delete.
         """
         deleted_role, deleted_channel = None, None
-        team_role = discord.utils.get(guild.roles, name=team.team_role)
+        team_role = find_role(guild, team.team_role)
 
         if not team_role:
             logger.warning(f"Could not find role '{team.team_role}' to deprovision.")
             return None, None
 
         # Remove all relevant roles from every member of the team role
-        for member in list(team_role.members):
+        async def remove_member_roles(member: discord.Member):
             try:
                 roles_to_remove = [r for r in [team_role, team_leader_role, team_member_role] if r and r in member.roles]
                 if roles_to_remove:
-                    await member.remove_roles(*roles_to_remove, reason="Marathon end")
+                    await limiter.run(partial(member.remove_roles, *roles_to_remove, reason="Marathon end"))
             except discord.Forbidden:
                 logger.warning(f"Missing permissions to remove roles from {member.display_name}.")
             except discord.HTTPException as e:
                 logger.error(f"Failed to remove roles from {member.display_name}: {e}")
 
+        await asyncio.gather(*(remove_member_roles(member) for member in list(team_role.members)))
+
         # Delete the team channel
-        channel = discord.utils.get(guild.text_channels, name=team.channel_name.lower())
+        channel = find_text_channel(guild, team.channel_name.lower())
         if channel:
             try:
-                await channel.delete(reason="Marathon end")
+                await limiter.run(partial(channel.delete, reason="Marathon end"))
                 deleted_channel = channel
             except discord.Forbidden:
                 logger.warning(f"Missing permissions to delete channel {channel.name}.")
@@ -167,7 +203,7 @@ class MarathonService:
 
         # Delete the team role itself
         try:
-            await team_role.delete(reason="Marathon end")
+            await limiter.run(partial(team_role.delete, reason="Marathon end"))
             deleted_role = team_role
         except discord.Forbidden:
             logger.warning(f"Missing permissions to delete role {team_role.name}.")
@@ -1,9 +1,10 @@
 import logging
 import re
-from typing import Dict, Set, List
+from typing import Dict, List, Optional, Set
 import numpy as np
 from ..services.category_matcher import CategoryMatcher
 from ..utils.timezone_utils import TimezoneProcessor
+from ..utils.scoring_numba import similarity_bonus_score
 from config import (
     PERFECT_MATCH_THRESHOLD, PERFECT_MATCH_BONUS, MID_MATCH_THRESHOLD_LOW,
     MID_MATCH_THRESHOLD_HIGH, MID_MATCH_BONUS_INCREMENT, MID_MATCH_BONUS_CAP
@@ -57,17 +58,13 @@ class TeamScoringEngine:
         """Calculates a final score from a similarity matrix with bonuses for strong matches."""
         if matrix.size == 0: return 0.0
 
-        base_similarity = np.mean(matrix)
-
-        # Add a significant bonus for each "perfect" match
-        perfect_matches = np.sum(matrix >= PERFECT_MATCH_THRESHOLD)
-        bonus = perfect_matches * PERFECT_MATCH_BONUS
-
-        # Add a small, capped bonus for "mid-range" matches
-        mid_matches = np.sum((matrix >= MID_MATCH_THRESHOLD_LOW) & (matrix < MID_MATCH_THRESHOLD_HIGH))
-        bonus += min(MID_MATCH_BONUS_CAP, mid_matches * MID_MATCH_BONUS_INCREMENT)
-
-        return min(1.0, base_similarity + bonus)
+        # Mean similarity, plus a significant bonus for each "perfect" match
+        # and a small, capped bonus for "mid-range" matches
+        return similarity_bonus_score(
+            matrix, PERFECT_MATCH_THRESHOLD, PERFECT_MATCH_BONUS,
+            MID_MATCH_THRESHOLD_LOW, MID_MATCH_THRESHOLD_HIGH,
+            MID_MATCH_BONUS_INCREMENT, MID_MATCH_BONUS_CAP
+        )
 
     async def calculate_semantic_compatibility(self, profile1: Dict, profile2: Dict) -> float:
         """Calculates compatibility based on the semantic similarity of goals and habits."""
@@ -90,27 +87,49 @@ class TeamScoringEngine:
         if not scores: return 0.0
         return np.average(scores, weights=weights)
 
-    def calculate_member_team_fit(self, member_profile: Dict, team_leaders: List[Dict]) -> Dict[str, float]:
+    def calculate_tz_fit_matrix(self, member_profiles: List[Dict], leader_groups: List[List[Dict]]) -> np.ndarray:
+        """
+        Mean timezone compatibility of every member against every team's leaders, as a
+        len(member_profiles) x len(leader_groups) matrix. All member/leader pairs are scored
+        in a single pairwise_compat call; a group without leaders scores 0.0.
+        """
+        fit = np.zeros((len(member_profiles), len(leader_groups)))
+        leader_tzs = [leader.get("profile_data", {}).get("timezone") for group in leader_groups for leader in group]
+        if not member_profiles or not leader_tzs:
+            return fit
+
+        member_offsets = self.tz_processor.vectorize([profile.get("timezone") for profile in member_profiles])
+        pair_scores = self.tz_processor.pairwise_compat(member_offsets, self.tz_processor.vectorize(leader_tzs))
+
+        # Average each team's block of leader columns
+        sizes = np.array([len(group) for group in leader_groups])
+        has_leaders = sizes > 0
+        starts = (np.cumsum(sizes) - sizes)[has_leaders]
+        fit[:, has_leaders] = np.add.reduceat(pair_scores, starts, axis=1) / sizes[has_leaders]
+        return fit
+
+    def calculate_member_team_fit(self, member_profile: Dict, team_leaders: List[Dict], tz_score: Optional[float] = None) -> Dict[str, float]:
         """
         Calculates the average timezone and category fit between a member and team leaders.
         This new method centralizes logic previously duplicated in team_formation.py.
+        Callers scoring many pairs can pass a tz_score precomputed by calculate_tz_fit_matrix.
         """
         if not team_leaders:
             return {"tz_score": 0.0, "cat_score": 0.0}
 
-        member_tz_offset = self.tz_processor.parse_to_utc_offset(member_profile.get("timezone"))
         member_cats = self.get_member_categories(member_profile)
+        if tz_score is None:
+            member_tz_offset = self.tz_processor.parse_to_utc_offset(member_profile.get("timezone"))
 
         tz_scores, cat_scores = [], []
         for leader in team_leaders:
             leader_profile = leader.get("profile_data", {})
-            leader_tz_offset = self.tz_processor.parse_to_utc_offset(leader_profile.get("timezone"))
-            leader_cats = self.get_member_categories(leader_profile)
-
-            tz_scores.append(self.tz_processor.calculate_compatibility(member_tz_offset, leader_tz_offset))
-            cat_scores.append(self._calculate_categorical_score(member_cats, leader_cats))
+            if tz_score is None:
+                leader_tz_offset = self.tz_processor.parse_to_utc_offset(leader_profile.get("timezone"))
+                tz_scores.append(self.tz_processor.calculate_compatibility(member_tz_offset, leader_tz_offset))
+            cat_scores.append(self._calculate_categorical_score(member_cats, self.get_member_categories(leader_profile)))
 
         return {
-            "tz_score": np.mean(tz_scores) if tz_scores else 0.0,
-            "cat_score": np.mean(cat_scores) if cat_scores else 0.0
+            "tz_score": np.mean(tz_scores) if tz_score is None else tz_score,
+            "cat_score": np.mean(cat_scores)
         }
@@ -2,9 +2,10 @@ import logging
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
 import numpy as np
-from discord import Guild, utils
+from discord import Guild
 from ..utils.team_utils import fetch_member_safely, provision_roles_for_new_members, provision_team_resources, build_team_from_data
-from ..models.team import Team, TeamConfig, TeamMember, TeamNotFoundError
+from ..utils.name_index import find_role
+from ..models.team import Team, TEAM_CONFIG, TeamMember, TeamNotFoundError
 from .scoring_engine import TeamScoringEngine
 from config import MIN_CATEGORY_SCORE_THRESHOLD, MIN_TIMEZONE_SCORE_THRESHOLD
 
@@ -21,7 +22,7 @@ class TeamFormationService:
         self.scorer = scorer
         self.db = db_manager
         self.team_manager = team_manager_instance
-        self.config = TeamConfig()
+        self.config = TEAM_CONFIG
 
     async def form_teams_hierarchical(self, unassigned_leaders: List[Dict], unassigned_members: List[Dict]) -> List[Team]:
         """Forms new teams using a multi-phase hierarchical clustering algorithm."""
@@ -157,16 +158,18 @@ class TeamFormationService:
         logger.info(f"Phase 4: Reassigning {len(orphans)} orphaned members...")
         unassigned = []
 
-        for orphan in orphans:
+        # Orphans are never leaders, so every team's leaders stay fixed and all timezone fits can be scored up front
+        leader_groups = [[m.to_dict() for m in team.get_leaders()] for team in teams] # Pass plain dicts to the scorer
+        tz_fit = self.scorer.calculate_tz_fit_matrix([orphan.profile_data for orphan in orphans], leader_groups)
+
+        for i, orphan in enumerate(orphans):
             candidate_teams = []
-            for team in teams:
+            for j, (team, team_leaders) in enumerate(zip(teams, leader_groups)):
                 if len(team.members) >= self.config.max_team_size: continue
-
-                team_leaders = [vars(m) for m in team.get_leaders()] # Use vars() to pass dict
                 if not team_leaders: continue
 
                 # Use the centralized scoring method
-                fit_scores = self.scorer.calculate_member_team_fit(orphan.profile_data, team_leaders)
+                fit_scores = self.scorer.calculate_member_team_fit(orphan.profile_data, team_leaders, tz_score=tz_fit[i, j])
                 candidate_teams.append({'team': team, 'size': len(team.members), **fit_scores})
 
             if not candidate_teams:
@@ -192,14 +195,16 @@ class TeamFormationService:
         profile_data = member_profile.get("profile_data", {})
         recommendations = []
 
-        for team in all_teams:
-            if len(team.members) >= self.config.max_team_size: continue
+        open_teams = [team for team in all_teams if len(team.members) < self.config.max_team_size]
+        leader_groups = [[m.to_dict() for m in team.get_leaders()] for team in open_teams]
+        # Timezone fit against every open team in one batch
+        tz_fit = self.scorer.calculate_tz_fit_matrix([profile_data], leader_groups)[0]
 
-            team_leaders = [vars(m) for m in team.get_leaders()]
+        for team, team_leaders, tz_score in zip(open_teams, leader_groups, tz_fit):
             if not team_leaders: continue
 
             # Use the centralized scoring method, removing duplicated logic
-            fit_scores = self.scorer.calculate_member_team_fit(profile_data, team_leaders)
+            fit_scores = self.scorer.calculate_member_team_fit(profile_data, team_leaders, tz_score=tz_score)
             recommendations.append({
                 "team_name": team.team_role,
                 "size": len(team.members),
@@ -232,12 +237,12 @@ class TeamFormationService:
 
         # 3. Add member and update database
         team.members[user_id] = TeamMember(user_id=user_id, **member_profile)
-        await self.db.update_team_members(guild.id, team.team_role, {uid: vars(mem) for uid, mem in team.members.items()})
+        await self.db.update_team_members(guild.id, team.team_role, {uid: mem.to_dict() for uid, mem in team.members.items()})
         await self.db.remove_unregistered_member(guild.id, user_id)
 
         # 4. Assign Discord role
         discord_member = await fetch_member_safely(guild, user_id)
-        team_role = utils.get(guild.roles, name=team.team_role)
+        team_role = find_role(guild, team.team_role)
         if discord_member and team_role:
             await discord_member.add_roles(team_role, reason=f"Assigned to team {team.team_role}")
 
@@ -252,6 +257,9 @@ class TeamFormationService:
     async def batch_create_teams(self, guild: Guild, proposed_teams: List[Team]) -> Dict:
         """Creates multiple teams in the database from a proposed formation."""
         created_count, failed_teams = 0, []
+        # Resolve batch-wide state once instead of per proposed team; role/channel lookups go through the guild's name index
+        marathon_active = await self.team_manager.team_service.is_marathon_active(guild.id)
+
         for i, team_obj in enumerate(proposed_teams, 1):
             try:
                 new_team_number = await self.db.get_max_team_number(guild.id) + 1
@@ -263,10 +271,9 @@ class TeamFormationService:
                     "team_number": new_team_number,
                     "team_role": team_role_name,
                     "channel_name": f"team-{new_team_number}",
-                    "members": {uid: vars(member) for uid, member in team_obj.members.items()}
+                    "members": {uid: member.to_dict() for uid, member in team_obj.members.items()}
                 })
 
-                marathon_active = await self.team_manager.team_service.is_marathon_active(guild.id)
                 if marathon_active:
                     raw_team_data = await self.db.get_team_by_name(guild.id, team_role_name)
                     team = build_team_from_data(guild.id, raw_team_data)
@@ -1,8 +1,9 @@
+import asyncio
 import logging
 import discord
 from typing import Dict, List
 
-from ..models.team import TeamConfig
+from ..models.team import TEAM_CONFIG
 from ..services.team_service import TeamService
 from ..services.team_member_service import TeamMemberService
 from ..services.team_validation import TeamValidator
@@ -18,7 +19,7 @@ class TeamManager:
     """
     def __init__(self, db, ai_handler, scorer):
         self.db = db
-        self.config = TeamConfig()
+        self.config = TEAM_CONFIG
         self.ai_handler = ai_handler
         self.scorer = scorer
 
@@ -76,24 +77,24 @@ class TeamManager:
         Analyzes and reports on the consistency of team data by orchestrating
         calls to the team and member services.
         """
-        teams = await self.get_all_teams(guild.id)
-        empty_teams, no_leader_teams = [], []
-
-        for team in teams:
-            if not team.members:
-                empty_teams.append(team.team_role) #
-                continue
-
-            # This logic could be further delegated if needed
-            _, has_leader = await self.member_service._update_team_members_data(guild, team.members) #
-            if not has_leader:
-                no_leader_teams.append(team.team_role) #
+        # Independent reads, fetched concurrently
+        teams, unregistered_doc = await asyncio.gather(
+            self.get_all_teams(guild.id), self.db.get_unregistered_document(guild.id)
+        )
+        empty_teams = [team.team_role for team in teams if not team.members]
+        staffed_teams = [team for team in teams if team.members]
+
+        # This logic could be further delegated if needed
+        member_updates = await asyncio.gather(*(
+            self.member_service._update_team_members_data(guild, team.members) for team in staffed_teams
+        ))
+        no_leader_teams = [team.team_role for team, (_, has_leader) in zip(staffed_teams, member_updates) if not has_leader]
 
         # Get all members currently in a team to pass to the sync function
         all_team_member_ids = {uid for team in teams for uid in team.members.keys()} #
 
         # Perform synchronization of unassigned members and get the report
-        sync_report = await self.member_service.sync_unregistered_members(guild, all_team_member_ids) #
+        sync_report = await self.member_service.sync_unregistered_members(guild, all_team_member_ids, unregistered_doc) #
 
         return {
             "empty_teams": empty_teams,
@@ -116,3 +117,6 @@ class TeamManager:
           except Exception as e:
               logger.error(f"Error during data sync for guild {guild.id}: {e}", exc_info=True)
               return {}
+          finally:
+              # A full sync is the point where cached reads must line up with the database again
+              self.db.invalidate_unregistered_cache(guild.id)
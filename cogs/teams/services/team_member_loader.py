@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+class TeamMemberLoader:
+    """
+    Coalesces member-to-team lookups into batched queries.
+
+    Lookups issued for the same guild within a short window (e.g. several bulk
+    add-member commands running at once) are resolved together with a single
+    find_teams_by_members query instead of one round-trip per member.
+    """
+
+    def __init__(self, db, window: float = 0.005):
+        self.db = db
+        self.window = window
+        self._pending: Dict[int, Dict[str, asyncio.Future]] = {}
+        self._dispatchers: Set[asyncio.Task] = set()
+
+    async def load(self, guild_id: int, user_id: str) -> Optional[str]:
+        """Returns the team role the member belongs to, or None if they are in no team."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(guild_id)
+        if pending is None:
+            pending = self._pending[guild_id] = {}
+            task = loop.create_task(self._dispatch(guild_id))
+            self._dispatchers.add(task)
+            task.add_done_callback(self._dispatchers.discard)
+
+        future = pending.get(user_id)
+        if future is None:
+            future = pending[user_id] = loop.create_future()
+        # Shielded so one cancelled caller doesn't cancel the lookup for others sharing it
+        return await asyncio.shield(future)
+
+    async def load_many(self, guild_id: int, user_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Resolves several members at once, returning a user_id -> team role (or None) mapping."""
+        user_ids = list(user_ids)
+        team_roles = await asyncio.gather(*(self.load(guild_id, uid) for uid in user_ids))
+        return dict(zip(user_ids, team_roles))
+
+    async def _dispatch(self, guild_id: int):
+        """Waits for the batching window to close, then resolves every pending lookup for the guild."""
+        await asyncio.sleep(self.window)
+        pending = self._pending.pop(guild_id)
+        try:
+            team_by_member = await self.db.find_teams_by_members(guild_id, pending.keys())
+        except Exception as e:
+            logger.error(f"Batched team lookup failed for guild {guild_id}: {e}")
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for user_id, future in pending.items():
+            if not future.done():
+                future.set_result(team_by_member.get(user_id))
@@ -2,6 +2,7 @@ import discord
 from typing import Dict, List, Set, Tuple, Optional
 from ..models.team import Team, TeamMember
 from ..utils.team_utils import fetch_member_safely, get_member_role_title
+from ..utils.name_index import find_role
 from .team_validation import TeamValidator
 
 class TeamMemberService:
@@ -42,7 +43,7 @@ class TeamMemberService:
         if valid_ids:
             new_member_objects = await self.create_member_objects(guild, valid_ids, not is_marathon_active)
             team.members.update(new_member_objects)
-            await self.db.update_team_members(guild.id, team.team_role, {uid: vars(m) for uid, m in team.members.items()})
+            await self.db.update_team_members(guild.id, team.team_role, {uid: m.to_dict() for uid, m in team.members.items()})
             new_members = list(new_member_objects.values())
 
         existing_members = conflict_dict.get("existing", [])
@@ -83,14 +84,19 @@ class TeamMemberService:
                 invalid_members.append(uid)
 
         if removed_members:
-            await self.db.update_team_members(guild_id, team.team_role, {uid: vars(m) for uid, m in team.members.items()})
+            await self.db.update_team_members(guild_id, team.team_role, {uid: m.to_dict() for uid, m in team.members.items()})
 
         return removed_members, invalid_members
 
-    async def sync_unregistered_members(self, guild: discord.Guild, all_team_member_ids: set) -> dict:
-        """Synchronizes the unregistered members list with Discord roles and returns a report."""
+    async def sync_unregistered_members(self, guild: discord.Guild, all_team_member_ids: set, unregistered_doc: Optional[Dict] = None) -> dict:
+        """
+        Synchronizes the unregistered members list with Discord roles and returns a report.
+        Callers that already fetched the unregistered document can pass it in.
+        """
         # 1. Get all tracked unregistered member IDs from the DB
-        unregistered_doc = await self.db.get_unregistered_document(guild.id) or {} #
+        if unregistered_doc is None:
+            unregistered_doc = await self.db.get_unregistered_document(guild.id)
+        unregistered_doc = unregistered_doc or {} #
         unregistered_leaders = unregistered_doc.get("leaders", {})
         unregistered_members = unregistered_doc.get("members", {})
         all_unregistered_ids = set(unregistered_leaders.keys()) | set(unregistered_members.keys()) #
@@ -103,9 +109,10 @@ class TeamMemberService:
                 await self.db.remove_unregistered_member(guild.id, user_id) #
 
         # 3. Find and add new members with team roles but no team
-        team_leader_role = discord.utils.get(guild.roles, name="Team Leader")
-        team_member_role = discord.utils.get(guild.roles, name="Team Member")
+        team_leader_role = find_role(guild, "Team Leader")
+        team_member_role = find_role(guild, "Team Member")
 
+        new_unregistered = []
         for member in guild.members:
             if member.bot: continue
 
@@ -116,7 +123,10 @@ class TeamMemberService:
                 role_title = get_member_role_title(member)
                 role_type = "leaders" if role_title == "Team Leader" else "members"
                 member_data = {"username": member.name, "display_name": member.display_name, "role_title": role_title, "profile_data": {}}
-                await self.db.save_unregistered_member(guild.id, member_id, member_data, role_type) #
+                new_unregistered.append((member_id, member_data, role_type))
+
+        # Saved in a single write rather than one round-trip per member
+        await self.db.save_unregistered_members_bulk(guild.id, new_unregistered)
 
         # 4. Generate the final report from the now-synced database
         final_doc = await self.db.get_unregistered_document(guild.id) or {} #
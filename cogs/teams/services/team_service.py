@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import re
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple
 
 import discord
-from ..models.team import Team, TeamError, TeamNotFoundError, InvalidTeamError, TeamMember, TeamConfig
+from ..models.team import Team, TeamError, TeamNotFoundError, InvalidTeamError, TEAM_CONFIG
 from ..utils import team_utils
 
 logger = logging.getLogger(__name__)
@@ -12,7 +13,7 @@ class TeamService:
     """Handles high-level team CRUD and state management operations."""
 
     def __init__(self, db, validator, member_service):
-        self.config = TeamConfig()
+        self.config = TEAM_CONFIG
         self.db = db
         self.validator = validator
         self.member_service = member_service
@@ -36,6 +37,11 @@ class TeamService:
     async def is_marathon_active(self, guild_id: int) -> bool:
         return await self.db.get_marathon_state(guild_id)
 
+    async def get_marathon_status_and_teams(self, guild_id: int) -> Tuple[bool, List[Team]]:
+        """Fetches the marathon state and all teams of a guild concurrently."""
+        is_active, teams = await asyncio.gather(self.is_marathon_active(guild_id), self.get_all_teams(guild_id))
+        return is_active, teams
+
     async def get_marathon_state_info(self, guild_id: int) -> Dict:
         """
         Retrieves the full marathon state document, providing a default if none exists.
@@ -109,12 +115,18 @@ class TeamService:
         """Updates the channel name for a specific team in the database."""
         formatted_name = self.validator.format_and_validate_channel_name(new_channel_name)
         result = await self.db.update_team_channel_name(guild_id, team_name, formatted_name)
+        if result and result.matched_count == 0:
+            raise TeamNotFoundError(f"Team '{team_name}' not found.")
         if result and result.modified_count > 0:
             logger.info(f"Successfully updated channel name for team '{team_name}' to '{formatted_name}'.")
             return True
         logger.warning(f"Attempted to update channel name for team '{team_name}' but no changes were made.")
         return False
 
+    async def update_team_channel_id(self, guild_id: int, team_name: str, channel_id: int):
+        """Remembers the Discord channel backing a team."""
+        await self.db.update_team_channel_id(guild_id, team_name, channel_id)
+
     async def fetch_server_teams(self, guild: discord.Guild) -> dict:
         """Scans the server for existing team roles and registers them in the database."""
         registered_count = 0
@@ -158,14 +170,20 @@ class TeamService:
                 skipped_details.append(f"`{role.name}` (no private channel)")
                 continue
 
-            members_dict = {}
+            # Only the serialized form is persisted, so build the member dicts directly
+            members_payload: Dict[str, Dict] = {}
             for member in role.members:
                 if not member.bot:
-                    role_title = team_utils.get_member_role_title(member)
-                    team_member = TeamMember(user_id=str(member.id), username=member.name, display_name=member.display_name, role_title=role_title)
-                    members_dict[str(member.id)] = team_member
-
-            if not members_dict:
+                    user_id = str(member.id)
+                    members_payload[user_id] = {
+                        "user_id": user_id,
+                        "username": member.name,
+                        "display_name": member.display_name,
+                        "role_title": team_utils.get_member_role_title(member),
+                        "profile_data": {},
+                    }
+
+            if not members_payload:
                 skipped_details.append(f"`{role.name}` (no valid members)")
                 continue
 
@@ -174,7 +192,8 @@ class TeamService:
                 "team_number": team_number,
                 "team_role": role.name,
                 "channel_name": found_channel.name,
-                "members": {uid: tm.to_dict() for uid, tm in members_dict.items()}
+                "channel_id": found_channel.id,
+                "members": members_payload
             }
 
             try:
@@ -1,29 +1,40 @@
 import discord
 import re
+import string
 from typing import Set, Tuple, List, Dict
 
-from ..models.team import TeamConfig, InvalidTeamError, TeamMember
+from ..models.team import TEAM_CONFIG, InvalidTeamError, TeamMember
 from ..utils.team_utils import fetch_member_safely, get_member_role_title
+from .team_member_loader import TeamMemberLoader
+
+_MENTION_RE = re.compile(r"<@!?(\d+)>")
+_CHANNEL_NAME_INVALID_RE = re.compile(r"[^a-z0-9\-]")
+_CHANNEL_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "-")
 
 class TeamValidator:
     """Handles validation logic for teams and members."""
 
     def __init__(self, db):
         self.db = db
-        self.config = TeamConfig()
+        self.config = TEAM_CONFIG
+        self.member_loader = TeamMemberLoader(db)
 
     def validate_team_number(self, team_number: int):
         if not 1 <= team_number <= self.config.max_team_number:
             raise InvalidTeamError(f"Team number must be between 1 and {self.config.max_team_number}.")
 
     def format_and_validate_channel_name(self, channel_name: str) -> str:
-        formatted = re.sub(r"[^a-z0-9\-]", "", channel_name.lower().replace(' ', '-'))
+        # Fast path: already-formatted names (e.g. on rename) need no rewriting
+        if 3 <= len(channel_name) <= self.config.max_team_name_length and _CHANNEL_NAME_CHARS.issuperset(channel_name):
+            return channel_name
+
+        formatted = _CHANNEL_NAME_INVALID_RE.sub("", channel_name.lower().replace(' ', '-'))
         if not 3 <= len(formatted) <= self.config.max_team_name_length:
             raise InvalidTeamError(f"Channel name must be 3-{self.config.max_team_name_length} alphanumeric characters or hyphens.")
         return formatted
 
     def parse_member_mentions(self, member_mentions: str) -> Set[str]:
-        mention_ids = set(re.findall(r"<@!?(\d+)>", member_mentions))
+        mention_ids = {match.group(1) for match in _MENTION_RE.finditer(member_mentions)}
         if not mention_ids:
             raise InvalidTeamError("You must mention at least one member.")
         return mention_ids
@@ -35,20 +46,22 @@ class TeamValidator:
 
         valid_ids, invalid_members, conflicted_members = set(), [], {}
 
+        candidate_ids = []
         for user_id in member_ids:
             member = await fetch_member_safely(guild, user_id)
             if not member or member.bot or (get_member_role_title(member) == "Unregistered" and not allow_unregistered):
                 invalid_members.append(user_id)
                 continue
+            candidate_ids.append(user_id)
 
-            # Check if member is already in another team
-            other_team_doc = await self.db.find_team_by_member(guild.id, user_id)
-            if other_team_doc:
-                other_team_name = other_team_doc.get("team_role")
-                # If adding to a team, check if it's the *same* team
-                if not target_team_name or other_team_name != target_team_name:
-                    conflicted_members[user_id] = f"already in {other_team_name}"
-                    continue
+        # Check if members are already in another team, resolved in one batched lookup
+        team_by_member = await self.member_loader.load_many(guild.id, candidate_ids)
+        for user_id in candidate_ids:
+            other_team_name = team_by_member[user_id]
+            # If adding to a team, check if it's the *same* team
+            if other_team_name and (not target_team_name or other_team_name != target_team_name):
+                conflicted_members[user_id] = f"already in {other_team_name}"
+                continue
 
             valid_ids.add(user_id)
 
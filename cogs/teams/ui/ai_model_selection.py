@@ -1,7 +1,6 @@
 import discord
 from discord.ui import View, Button, Modal, TextInput
 import logging
-import math
 
 # Assuming your config file is accessible
 from config import (
@@ -21,6 +20,18 @@ MODEL_MAP = {
 }
 MODELS_PER_PAGE = 10 # Reduced for better display in a code block
 
+def _paginate_models(models):
+    """Pre-joins a brand's models into one display string per page."""
+    return [
+        "\n".join(models[i:i + MODELS_PER_PAGE])
+        for i in range(0, len(models), MODELS_PER_PAGE)
+    ] or [""]
+
+# Page bodies per brand, built once since the model lists are static
+MODEL_PAGES = {brand: _paginate_models(info["models"]) for brand, info in MODEL_MAP.items()}
+# Per-brand lookup sets for validating typed model names
+MODEL_SETS = {brand: frozenset(info["models"]) for brand, info in MODEL_MAP.items()}
+
 # --- The Modal for Final Selection ---
 
 class ModelSelectionModal(Modal):
@@ -29,7 +40,7 @@ class ModelSelectionModal(Modal):
         self.db = db
         self.original_interaction = original_interaction
         self.parent_view = parent_view
-        self.valid_models = parent_view.all_models_for_brand
+        self.valid_models = parent_view._valid_models_set
 
         self.model_name_input = TextInput(
             label="Model Name",
@@ -83,6 +94,9 @@ class AIModelSelectionView(View):
         self.current_brand = None
         self.current_page = 0
         self.all_models_for_brand = []
+        self._page_bodies = [""]
+        self._total_pages = 1
+        self._valid_models_set = frozenset()
 
     async def start(self):
         """Sends the initial message with the category view."""
@@ -104,23 +118,18 @@ class AIModelSelectionView(View):
 
     def _build_model_embed(self):
         """Builds the embed for the model selection screen."""
-        total_pages = math.ceil(len(self.all_models_for_brand) / MODELS_PER_PAGE)
         embed = discord.Embed(
             title=f"Configuration > {self.current_brand}",
             description="Browse the models below. Click 'Select a Model' to confirm your choice.",
             color=discord.Color.purple()
         )
 
-        start_index = self.current_page * MODELS_PER_PAGE
-        end_index = start_index + MODELS_PER_PAGE
-        models_on_page = self.all_models_for_brand[start_index:end_index]
-
         embed.add_field(
             name="Available Models",
-            value=f"```\n" + "\n".join(models_on_page) + "\n```",
+            value=f"```\n{self._page_bodies[self.current_page]}\n```",
             inline=False
         )
-        embed.set_footer(text=f"Page {self.current_page + 1}/{total_pages}")
+        embed.set_footer(text=f"Page {self.current_page + 1}/{self._total_pages}")
         return embed
 
     def _update_components(self):
@@ -132,7 +141,7 @@ class AIModelSelectionView(View):
             self.add_item(Button(label="Cancel", style=discord.ButtonStyle.danger, custom_id="cancel"))
 
         elif self.current_stage == "model":
-            total_pages = math.ceil(len(self.all_models_for_brand) / MODELS_PER_PAGE)
+            total_pages = self._total_pages
             # Row 1: Navigation
             prev_button = Button(label="◀️ Previous", custom_id="prev_page", disabled=self.current_page == 0)
             next_button = Button(label="Next ▶️", custom_id="next_page", disabled=self.current_page >= total_pages - 1)
@@ -161,12 +170,15 @@ class AIModelSelectionView(View):
             self.current_stage = "model"
             self.current_page = 0
             self.all_models_for_brand = MODEL_MAP.get(self.current_brand, {}).get("models", [])
+            self._page_bodies = MODEL_PAGES.get(self.current_brand) or _paginate_models(self.all_models_for_brand)
+            self._total_pages = len(self._page_bodies)
+            self._valid_models_set = MODEL_SETS.get(self.current_brand) or frozenset(self.all_models_for_brand)
 
         # --- Stage 2: Model Navigation & Selection ---
         elif custom_id == "prev_page":
             if self.current_page > 0: self.current_page -= 1
         elif custom_id == "next_page":
-            self.current_page += 1
+            if self.current_page < self._total_pages - 1: self.current_page += 1
         elif custom_id == "back_to_category":
             self.current_stage = "category"
         elif custom_id == "select_model":
@@ -1,15 +1,49 @@
 import discord
 from discord.ui import Button
-from typing import Dict
+from collections import ChainMap
+from typing import Dict, Optional
 import logging
 
-from ..models.team import TeamNotFoundError
-from .modals import DeleteMemberModal, EditChannelNameModal, TeamFormationModal
+from .modals import DeleteMemberModal, EditChannelNameModal, TeamFormationModal, views_module
 
 from ..permissions import moderator_required
 
 logger = logging.getLogger(__name__)
 
+_GENERIC_ERROR = "❌ An error occurred. The incident has been logged."
+
+# Discord's limit for an embed field's value
+_FIELD_VALUE_LIMIT = 1024
+
+
+def _add_bullet_fields(embed: discord.Embed, name: str, items, empty: Optional[str] = None):
+    """
+    Adds a bulleted list as one embed field, spilling into continuation fields
+    when it exceeds Discord's per-field length limit.
+    """
+    items = [str(item) for item in items]
+    if not items:
+        if empty is not None:
+            embed.add_field(name=name, value=empty, inline=False)
+        return
+
+    value = "• " + "\n• ".join(items)
+    if len(value) <= _FIELD_VALUE_LIMIT:
+        embed.add_field(name=name, value=value, inline=False)
+        return
+
+    field_name, chunk, size = name, [], 0
+    for item in items:
+        item = item[:_FIELD_VALUE_LIMIT - 2]
+        # "• " prefix plus the joining newline
+        line_len = len(item) + 3
+        if chunk and size + line_len > _FIELD_VALUE_LIMIT + 1:
+            embed.add_field(name=field_name, value="• " + "\n• ".join(chunk), inline=False)
+            field_name, chunk, size = f"{name} (cont.)", [], 0
+        chunk.append(item)
+        size += line_len
+    embed.add_field(name=field_name, value="• " + "\n• ".join(chunk), inline=False)
+
 class TeamButton(Button):
     """
     Base class for team management buttons. It provides centralized error handling
@@ -24,11 +58,18 @@ class TeamButton(Button):
 
         super().__init__(**kwargs)
 
+    @classmethod
+    def make(cls, team_manager, marathon_service, panel_manager, db):
+        """Builds the button from the full set of panel dependencies, taking only the ones it needs."""
+        return cls(team_manager, panel_manager)
+
     async def handle_error(self, interaction: discord.Interaction, error: Exception):
         """Standardized error handling for all button interactions."""
         logger.error(f"Error in '{self.label}' button: {error}", exc_info=True)
-        responder = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
-        await responder("❌ An error occurred. The incident has been logged.", ephemeral=True)
+        try:
+            await interaction.response.send_message(_GENERIC_ERROR, ephemeral=True)
+        except discord.InteractionResponded:
+            await interaction.followup.send(_GENERIC_ERROR, ephemeral=True)
 
 class ViewTeamButton(TeamButton):
     """Button to view detailed information about registered teams."""
@@ -37,12 +78,11 @@ class ViewTeamButton(TeamButton):
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         try:
-            from .views import TeamDropdownView # Avoid circular import
             teams = await self.team_manager.team_service.get_all_teams(interaction.guild_id)
             if not teams:
                 return await interaction.response.send_message("ℹ️ No teams are registered in the database.", ephemeral=True)
 
-            view = TeamDropdownView(self.team_manager, self.panel_manager, teams, action="view")
+            view = views_module().TeamDropdownView(self.team_manager, self.panel_manager, teams, action="view")
             await interaction.response.send_message("Select a team to view its details:", view=view, ephemeral=True)
         except Exception as e:
             await self.handle_error(interaction, e)
@@ -54,12 +94,11 @@ class DeleteTeamButton(TeamButton):
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         try:
-            from .views import TeamDropdownView # Avoid circular import
             teams = await self.team_manager.team_service.get_all_teams(interaction.guild_id)
             if not teams:
                 return await interaction.response.send_message("ℹ️ No teams are available to delete.", ephemeral=True)
 
-            view = TeamDropdownView(self.team_manager, self.panel_manager, teams, action="delete")
+            view = views_module().TeamDropdownView(self.team_manager, self.panel_manager, teams, action="delete")
             await interaction.response.send_message("Select a team to delete:", view=view, ephemeral=True)
         except Exception as e:
             await self.handle_error(interaction, e)
@@ -68,13 +107,17 @@ class StartMarathonButton(TeamButton):
     """Button to start the team marathon, creating roles and channels."""
     def __init__(self, team_manager, marathon_service, panel_manager):
         super().__init__(team_manager=team_manager, marathon_service=marathon_service, panel_manager=panel_manager, label="Start Marathon", style=discord.ButtonStyle.success, custom_id="start_marathon_button", row=1)
+
+    @classmethod
+    def make(cls, team_manager, marathon_service, panel_manager, db):
+        return cls(team_manager, marathon_service, panel_manager)
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer(thinking=True, ephemeral=True)
         try:
-            if await self.team_manager.team_service.is_marathon_active(interaction.guild.id):
+            is_active, teams = await self.team_manager.team_service.get_marathon_status_and_teams(interaction.guild.id)
+            if is_active:
                 return await interaction.followup.send("⚠️ Marathon is already active for this server.", ephemeral=True)
-            teams = await self.team_manager.team_service.get_all_teams(interaction.guild.id)
             if not teams:
                 return await interaction.followup.send("❌ No registered teams found to start a marathon.", ephemeral=True)
 
@@ -89,12 +132,10 @@ class StartMarathonButton(TeamButton):
     def _build_results_embed(self, results: Dict) -> discord.Embed:
         """Creates an embed summarizing the results of starting the marathon."""
         embed = discord.Embed(title="🚀 Marathon Start Results", color=discord.Color.green())
-        if results['created_roles']:
-            embed.add_field(name="✅ Roles Created", value="\n".join(f"• {r}" for r in results['created_roles']), inline=False)
-        if results['created_channels']:
-            embed.add_field(name="✅ Channels Created", value="\n".join(f"• {c}" for c in results['created_channels']), inline=False)
-        if results['skipped_teams']:
-            embed.add_field(name="⚠️ Skipped Teams", value="\n".join(f"• {t}" for t in results['skipped_teams']), inline=False)
+        roles, channels, skipped = results.get('created_roles'), results.get('created_channels'), results.get('skipped_teams')
+        _add_bullet_fields(embed, "✅ Roles Created", roles or ())
+        _add_bullet_fields(embed, "✅ Channels Created", channels or ())
+        _add_bullet_fields(embed, "⚠️ Skipped Teams", skipped or ())
         if not embed.fields:
             embed.description = "No new roles or channels were created."
         return embed
@@ -103,13 +144,18 @@ class EndMarathonButton(TeamButton):
     """Button to end the marathon, cleaning up all related roles and channels."""
     def __init__(self, team_manager, marathon_service, panel_manager):
         super().__init__(team_manager=team_manager, marathon_service=marathon_service, panel_manager=panel_manager, label="End Marathon", style=discord.ButtonStyle.danger, custom_id="end_marathon_button", row=1)
+
+    @classmethod
+    def make(cls, team_manager, marathon_service, panel_manager, db):
+        return cls(team_manager, marathon_service, panel_manager)
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer(thinking=True, ephemeral=True)
         try:
-            if not await self.team_manager.team_service.is_marathon_active(interaction.guild.id):
+            is_active, teams = await self.team_manager.team_service.get_marathon_status_and_teams(interaction.guild.id)
+            if not is_active:
                 return await interaction.followup.send("⚠️ No active marathon found for this server.", ephemeral=True)
-            results = await self.marathon_service.end_marathon(interaction.guild)
+            results = await self.marathon_service.end_marathon(interaction.guild, teams)
             if "error" in results:
                 return await interaction.followup.send(f"❌ {results['error']}", ephemeral=True)
             if not results['removed_channels'] and not results['processed_teams']:
@@ -123,8 +169,9 @@ class EndMarathonButton(TeamButton):
     def _build_results_embed(self, results: Dict) -> discord.Embed:
         """Creates an embed summarizing the results of ending the marathon."""
         embed = discord.Embed(title="🏁 Marathon End Results", description="Cleanup summary:", color=discord.Color.orange())
-        embed.add_field(name="🗑️ Channels Removed", value="\n".join(f"• {c}" for c in results['removed_channels']) or "None", inline=False)
-        embed.add_field(name="✨ Teams Processed", value="\n".join(f"• {t}" for t in results['processed_teams']) or "None", inline=False)
+        channels, teams = results.get('removed_channels') or (), results.get('processed_teams') or ()
+        _add_bullet_fields(embed, "🗑️ Channels Removed", channels, empty="None")
+        _add_bullet_fields(embed, "✨ Teams Processed", teams, empty="None")
         return embed
 
 class RefreshButton(TeamButton):
@@ -134,6 +181,10 @@ class RefreshButton(TeamButton):
     """
     def __init__(self, panel_manager):
         super().__init__(panel_manager=panel_manager, label="Refresh", style=discord.ButtonStyle.secondary, custom_id="refresh_button", row=1)
+
+    @classmethod
+    def make(cls, team_manager, marathon_service, panel_manager, db):
+        return cls(panel_manager)
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer(thinking=True, ephemeral=True)
@@ -150,15 +201,18 @@ class ReflectButton(TeamButton):
     """
     def __init__(self, team_manager, panel_manager, db):
         super().__init__(team_manager=team_manager, panel_manager=panel_manager, db=db, label="Reflect & Form Teams", style=discord.ButtonStyle.secondary, custom_id="reflect_button", row=0)
+
+    @classmethod
+    def make(cls, team_manager, marathon_service, panel_manager, db):
+        return cls(team_manager, panel_manager, db)
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer(thinking=True, ephemeral=True)
         try:
-            from .views import ReflectionActionsView # Avoid circular import
             report = await self.team_manager.sync_database_with_discord(interaction.guild)
             embed = self.panel_manager.build_reflection_embed(report)
 
-            view = ReflectionActionsView(self.team_manager, self.panel_manager, self.db) if report.get("unassigned_leader_count", 0) + report.get("unassigned_member_count", 0) > 0 else discord.ui.View()
+            view = views_module().ReflectionActionsView(self.team_manager, self.panel_manager, self.db) if report.get("unassigned_leader_count", 0) + report.get("unassigned_member_count", 0) > 0 else discord.ui.View()
             await interaction.followup.send(embed=embed, view=view, ephemeral=True)
 
         except Exception as e:
@@ -213,14 +267,8 @@ class DeleteMemberButton(TeamButton):
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         try:
-            # Ensure team still exists before opening modal
-            team = await self.team_manager.team_service.get_team(interaction.guild_id, self.team_role)
-            if not team.members:
-                return await interaction.response.send_message(f"❌ Team `{self.team_role}` has no members to remove.", ephemeral=True)
-
+            # The modal loads the team on submit and reports a missing or empty team itself
             await interaction.response.send_modal(DeleteMemberModal(self.team_manager, self.panel_manager, self.team_role))
-        except TeamNotFoundError:
-            await interaction.response.send_message(f"❌ Team `{self.team_role}` no longer exists.", ephemeral=True)
         except Exception as e:
             await self.handle_error(interaction, e)
 
@@ -232,11 +280,8 @@ class EditChannelNameButton(TeamButton):
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         try:
-            # Ensure team exists before opening modal
-            await self.team_manager.team_service.get_team(interaction.guild_id, self.team_data["team_role"])
+            # The rename reports a team deleted in the meantime on submit
             await interaction.response.send_modal(EditChannelNameModal(self.team_manager, self.panel_manager, self.team_data))
-        except TeamNotFoundError:
-            await interaction.response.send_message(f"❌ Team `{self.team_data['team_role']}` no longer exists.", ephemeral=True)
         except Exception as e:
             await self.handle_error(interaction, e)
 
@@ -269,7 +314,6 @@ class AssignMemberButton(TeamButton):
     @moderator_required
     async def callback(self, interaction: discord.Interaction):
         try:
-            from .views import UnregisteredMemberDropdownView # Avoid circular import
             unregistered_doc = await self.db.get_unregistered_document(interaction.guild_id)
 
             leaders = unregistered_doc.get("leaders", {}) if unregistered_doc else {}
@@ -278,7 +322,8 @@ class AssignMemberButton(TeamButton):
             if not leaders and not members:
                 return await interaction.response.send_message("ℹ️ There are no unassigned members to assign.", ephemeral=True)
 
-            view = UnregisteredMemberDropdownView(self.team_manager, self.panel_manager, {**leaders, **members})
+            # Zero-copy view over both pools; members listed last so they win on duplicate IDs, as before.
+            view = views_module().UnregisteredMemberDropdownView(self.team_manager, self.panel_manager, ChainMap(members, leaders))
             await interaction.response.send_message("Select a member to find a suitable team for them:", view=view, ephemeral=True)
         except Exception as e:
             await self.handle_error(interaction, e)
@@ -1,12 +1,38 @@
+import asyncio
 import discord
-import re
+import importlib
+import string
 from discord.ui import Modal, TextInput
 from typing import Dict
 import logging
-from ..models.team import TeamConfig, TeamError
+from ..models.team import TEAM_CONFIG, TeamError
 
 logger = logging.getLogger(__name__)
-config = TeamConfig()
+
+class _ChannelNameTable(dict):
+    """str.translate table that drops every character it has no explicit mapping for."""
+    def __missing__(self, codepoint):
+        return None
+
+
+# Keeps [a-z0-9-], lowercases ASCII letters and turns spaces into hyphens in a single pass
+_CHANNEL_NAME_TABLE = _ChannelNameTable(str.maketrans(
+    string.ascii_uppercase + string.ascii_lowercase + string.digits + "- ",
+    string.ascii_lowercase + string.ascii_lowercase + string.digits + "--",
+))
+
+_views_module = None
+
+
+def views_module():
+    """
+    Returns the views module, resolved once on first use. views imports buttons, which imports
+    this module, so neither buttons nor modals can import views at load time; both use this helper.
+    """
+    global _views_module
+    if _views_module is None:
+        _views_module = importlib.import_module(".views", __package__)
+    return _views_module
 
 
 class EditChannelNameModal(Modal, title="Edit Team Channel Name"):
@@ -14,7 +40,7 @@ class EditChannelNameModal(Modal, title="Edit Team Channel Name"):
         label="New Channel Name",
         placeholder="e.g., team-phoenix-crew",
         min_length=3,
-        max_length=config.max_team_name_length,
+        max_length=TEAM_CONFIG.max_team_name_length,
         required=True
     )
 
@@ -29,12 +55,17 @@ class EditChannelNameModal(Modal, title="Edit Team Channel Name"):
         await interaction.response.defer(thinking=True, ephemeral=True)
         try:
             formatted_name = self._format_channel_name(self.new_name.value)
+            # Persist first: a missing team raises here, before anything is renamed in Discord
             await self.team_manager.team_service.update_team_channel_name(
                 interaction.guild.id, self.team_data["team_role"], formatted_name
             )
-            await self._update_discord_channel(interaction.guild, formatted_name)
-            await interaction.followup.send(f"✅ Channel name updated to `{formatted_name}`.", ephemeral=True)
-            await self.panel_manager.refresh_team_panel(interaction.guild.id)
+            await self._update_discord_channel(
+                interaction.guild, formatted_name, reason=f"Channel rename by {interaction.user.display_name}"
+            )
+            await asyncio.gather(
+                interaction.followup.send(f"✅ Channel name updated to `{formatted_name}`.", ephemeral=True),
+                self.panel_manager.refresh_team_panel(interaction.guild.id)
+            )
         except TeamError as e:
             await interaction.followup.send(f"❌ {e}", ephemeral=True)
         except Exception as e:
@@ -42,20 +73,23 @@ class EditChannelNameModal(Modal, title="Edit Team Channel Name"):
             await interaction.followup.send("❌ Unexpected error while updating channel name.", ephemeral=True)
 
     def _format_channel_name(self, name: str) -> str:
-        name = name.lower().strip().replace(" ", "-")
-        name = re.sub(r"[^a-z0-9\-]", "", name)
+        name = name.strip().translate(_CHANNEL_NAME_TABLE)
         if len(name) < 3:
             raise TeamError("Channel name must be at least 3 valid characters long.")
         return name
 
-    async def _update_discord_channel(self, guild: discord.Guild, new_name: str):
+    async def _update_discord_channel(self, guild: discord.Guild, new_name: str, reason: str):
         old_name = self.team_data.get("channel_name")
-        if not old_name:
-            return
-        channel = discord.utils.get(guild.text_channels, name=old_name)
+        channel_id = self.team_data.get("channel_id")
+        # O(1) lookup by stored ID; fall back to a name scan once and remember the ID
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if not channel and old_name:
+            channel = next((c for c in guild.text_channels if c.name == old_name), None)
+            if channel:
+                await self.team_manager.team_service.update_team_channel_id(guild.id, self.team_data["team_role"], channel.id)
         if channel:
             try:
-                await channel.edit(name=new_name, reason=f"Channel rename by {guild.me.display_name}")
+                await channel.edit(name=new_name, reason=reason)
             except discord.Forbidden:
                 logger.warning(f"Missing permissions to rename channel '{old_name}'.")
             except discord.HTTPException as e:
@@ -80,19 +114,28 @@ class DeleteMemberModal(Modal, title="Remove Member(s) from Team"):
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(thinking=True, ephemeral=True)
         try:
-            input_numbers_str = [n.strip() for n in self.member_numbers.value.split(',')]
-            if not all(n.isdigit() for n in input_numbers_str):
-                return await interaction.followup.send("❌ Please enter valid numbers only.", ephemeral=True)
+            raw_numbers = self.member_numbers.value
+            if not raw_numbers.strip(" ,"):
+                return await interaction.followup.send("❌ Please enter at least one member number.", ephemeral=True)
+
+            # Validate and convert in one pass, bailing on the first bad token before any DB work
+            requested = []
+            for raw in raw_numbers.split(','):
+                num_str = raw.strip()
+                if not num_str.isdecimal():
+                    return await interaction.followup.send("❌ Please enter valid numbers only, separated by commas.", ephemeral=True)
+                requested.append((num_str, int(num_str) - 1))
 
             team = await self.team_manager.team_service.get_team(interaction.guild.id, self.team_role)
-            members_list = list(team.members.items())
+            if not team.members:
+                return await interaction.followup.send(f"❌ Team `{self.team_role}` has no members to remove.", ephemeral=True)
+            # Keys only: positions map straight to user IDs
+            member_ids = list(team.members)
 
             member_ids_to_remove, invalid_numbers = set(), []
-            for num_str in input_numbers_str:
-                idx = int(num_str) - 1
-                if 0 <= idx < len(members_list):
-                    user_id, _ = members_list[idx]
-                    member_ids_to_remove.add(user_id)
+            for num_str, idx in requested:
+                if 0 <= idx < len(member_ids):
+                    member_ids_to_remove.add(member_ids[idx])
                 else:
                     invalid_numbers.append(num_str)
 
@@ -142,17 +185,9 @@ class TeamFormationModal(Modal, title="Confirm New Team Formation"):
         await interaction.response.defer(thinking=True, ephemeral=True)
         try:
             unassigned_doc = await self.db.get_unregistered_document(interaction.guild_id)
-            leaders, members = [], []
-
-            if unassigned_doc:
-                for user_id, data in unassigned_doc.get("leaders", {}).items():
-                    leader_profile = dict(data)
-                    leader_profile["user_id"] = user_id
-                    leaders.append(leader_profile)
-                for user_id, data in unassigned_doc.get("members", {}).items():
-                    member_profile = dict(data)
-                    member_profile["user_id"] = user_id
-                    members.append(member_profile)
+            unassigned_doc = unassigned_doc or {}
+            leaders = [{**data, "user_id": user_id} for user_id, data in unassigned_doc.get("leaders", {}).items()]
+            members = [{**data, "user_id": user_id} for user_id, data in unassigned_doc.get("members", {}).items()]
 
             if not leaders and not members:
                 return await interaction.followup.send("ℹ️ No unassigned members found.", ephemeral=True)
@@ -170,8 +205,7 @@ class TeamFormationModal(Modal, title="Confirm New Team Formation"):
                 member_list = "\n".join([f"• {m.display_name} ({m.role_title})" for m in team.members.values()])
                 embed.add_field(name=f"Team {i}", value=member_list, inline=False)
 
-            from ..ui.views import FormationResultsView
-            view = FormationResultsView(self.team_manager, self.panel_manager, proposed_teams)
+            view = views_module().FormationResultsView(self.team_manager, self.panel_manager, proposed_teams)
             await interaction.followup.send(embed=embed, view=view, ephemeral=True)
         except Exception as e:
             logger.error(f"Error in TeamFormationModal: {e}", exc_info=True)
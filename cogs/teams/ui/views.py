@@ -1,9 +1,12 @@
+import asyncio
 import discord
+import io
+from itertools import islice
 from discord.ui import View, Select
-from typing import List, Dict, Optional
+from typing import List, Dict, Mapping, Optional
 import logging
 
-from ..utils.team_utils import fetch_member_safely, get_member_role_title
+from ..utils.team_utils import fetch_members_safely, get_member_role_title
 from ..models.team import Team, TeamNotFoundError
 from .buttons import (
     ViewTeamButton, DeleteTeamButton, StartMarathonButton, EndMarathonButton,
@@ -13,21 +16,24 @@ from .buttons import (
 
 logger = logging.getLogger(__name__)
 
+# One line of the team details member list; deactivated members use the same shape
+_MEMBER_LINE = "`{i:>2} • {name} • {role}`"
+
 # ========== Main Panel View ==========
 
 class MainPanelView(View):
     """Persistent Team Management Panel with primary action buttons."""
-    def __init__(self, team_manager, marathon_service, panel_manager, db, timeout: Optional[float] = None):
-        super().__init__(timeout=timeout)
+    _BUTTON_CLASSES = (
         # Row 0: Core Team & Reflection Actions
-        self.add_item(ViewTeamButton(team_manager, panel_manager))
-        self.add_item(DeleteTeamButton(team_manager, panel_manager))
-        self.add_item(ReflectButton(team_manager, panel_manager, db))
+        ViewTeamButton, DeleteTeamButton, ReflectButton,
         # Row 1: Marathon Lifecycle & Syncing
-        self.add_item(StartMarathonButton(team_manager,  marathon_service, panel_manager))
-        self.add_item(EndMarathonButton(team_manager,  marathon_service, panel_manager))
-        self.add_item(FetchDataButton(team_manager, panel_manager))
-        self.add_item(RefreshButton(panel_manager))
+        StartMarathonButton, EndMarathonButton, FetchDataButton, RefreshButton,
+    )
+
+    def __init__(self, team_manager, marathon_service, panel_manager, db, timeout: Optional[float] = None):
+        super().__init__(timeout=timeout)
+        for button_cls in self._BUTTON_CLASSES:
+            self.add_item(button_cls.make(team_manager, marathon_service, panel_manager, db))
 
 
 # ========== Team Selection & Management Views ==========
@@ -39,12 +45,14 @@ class TeamDropdown(Select):
         self.panel_manager = panel_manager
         self.action = action
 
+        # Select menus hold at most 25 options
+        select_option = discord.SelectOption
         options = [
-            discord.SelectOption(
+            select_option(
                 label=team.team_role,
                 description=f"#{team.channel_name} | {len(team.members)} members",
                 value=team.team_role
-            ) for team in teams
+            ) for team in teams[:25]
         ]
         super().__init__(placeholder=f"Select a team to {self.action}...", options=options, min_values=1, max_values=1)
 
@@ -82,16 +90,20 @@ class TeamDropdown(Select):
             embed.add_field(name="Members (0)", value="This team has no members.", inline=False)
             return embed
 
-        members_info = []
+        discord_members = await fetch_members_safely(guild, team.members)
+        # Lines go straight into one buffer instead of a list that is joined afterwards
+        members_info = io.StringIO()
         for i, (user_id, db_member) in enumerate(team.members.items(), 1):
-            discord_member = await fetch_member_safely(guild, user_id)
-            if discord_member:
-                line = f"`{i: >2} • {discord_member.display_name} • {get_member_role_title(discord_member)}`"
-            else:
-                line = f"`{i: >2} • {db_member.display_name} • (Deactivated)`"
-            members_info.append(line)
-
-        embed.add_field(name=f"Members ({len(team.members)})", value="\n".join(members_info), inline=False)
+            discord_member = discord_members[user_id]
+            if i > 1:
+                members_info.write("\n")
+            members_info.write(_MEMBER_LINE.format_map({
+                "i": i,
+                "name": discord_member.display_name if discord_member else db_member.display_name,
+                "role": get_member_role_title(discord_member) if discord_member else "(Deactivated)",
+            }))
+
+        embed.add_field(name=f"Members ({len(team.members)})", value=members_info.getvalue(), inline=False)
         embed.set_footer(text=f"Team ID: {team.team_role}")
         return embed
 
@@ -105,7 +117,7 @@ class TeamDropdownView(View):
 class TeamManagementView(View):
     def __init__(self, team_manager, panel_manager, team: Team, timeout: Optional[float] = 180):
         super().__init__(timeout=timeout)
-        team_data = {"team_role": team.team_role, "channel_name": team.channel_name}
+        team_data = {"team_role": team.team_role, "channel_name": team.channel_name, "channel_id": team.channel_id}
         self.add_item(EditChannelNameButton(team_manager, panel_manager, team_data))
         if team.members:
             self.add_item(DeleteMemberButton(team_manager, panel_manager, team.team_role))
@@ -120,17 +132,19 @@ class ConfirmDeleteView(View):
 # ========== Team Formation & Assignment Views ==========
 
 class UnregisteredMemberDropdown(Select):
-    def __init__(self, team_manager, panel_manager, unassigned_members: Dict[str, Dict]):
+    def __init__(self, team_manager, panel_manager, unassigned_members: Mapping[str, Dict]):
         self.team_manager = team_manager
         self.panel_manager = panel_manager
+        # A select menu holds at most 25 options, so only the first 25 are ever visited
+        select_option = discord.SelectOption
         options = [
-            discord.SelectOption(
+            select_option(
                 label=data.get('display_name', f"ID: {user_id}"),
                 description=f"Role: {data.get('role_title', 'Unknown')}",
                 value=user_id
-            ) for user_id, data in unassigned_members.items()
+            ) for user_id, data in islice(unassigned_members.items(), 25)
         ]
-        super().__init__(placeholder="Select an unassigned member...", options=options[:25])
+        super().__init__(placeholder="Select an unassigned member...", options=options)
 
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer(thinking=True, ephemeral=True)
@@ -151,7 +165,7 @@ class UnregisteredMemberDropdown(Select):
 
 
 class UnregisteredMemberDropdownView(View):
-    def __init__(self, team_manager, panel_manager, unassigned_members: Dict[str, Dict], timeout: float = 180):
+    def __init__(self, team_manager, panel_manager, unassigned_members: Mapping[str, Dict], timeout: float = 180):
         super().__init__(timeout=timeout)
         self.add_item(UnregisteredMemberDropdown(team_manager, panel_manager, unassigned_members))
 
@@ -161,8 +175,9 @@ class TeamRecommendationDropdown(Select):
         self.team_manager = team_manager
         self.panel_manager = panel_manager
         self.user_id = user_id
+        select_option = discord.SelectOption
         options = [
-            discord.SelectOption(label=rec['team_name'], description=f"Fit Score: {rec['score']}")
+            select_option(label=rec['team_name'], description=f"Fit Score: {rec['score']}")
             for rec in recommendations[:25]
         ]
         super().__init__(placeholder="Choose a team to assign the member to...", options=options)
@@ -175,14 +190,16 @@ class TeamRecommendationDropdown(Select):
             interaction.guild, self.user_id, selected_team_name
         )
 
-        for item in self.view.children:
-            item.disabled = True
+        # One-shot choice: stop listening and drop the components rather than re-sending them disabled
+        self.view.stop()
 
         response_prefix = "✅" if success else "❌"
-        await interaction.edit_original_response(content=f"{response_prefix} {message}", view=self.view)
-
+        edit_response = interaction.edit_original_response(content=f"{response_prefix} {message}", view=None)
         if success:
-            await self.panel_manager.refresh_team_panel(interaction.guild.id)
+            # Updating the reply and the panel are independent Discord calls
+            await asyncio.gather(edit_response, self.panel_manager.refresh_team_panel(interaction.guild.id))
+        else:
+            await edit_response
 
 
 class TeamRecommendationView(View):
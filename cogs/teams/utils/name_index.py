@@ -0,0 +1,101 @@
+import discord
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class GuildNameIndex:
+    """
+    Name -> object maps for one guild's roles and text channels.
+
+    discord.py only indexes these by ID, so every name lookup through
+    discord.utils.get is a linear scan. The index is built once per guild and
+    kept current by the role/channel gateway events forwarded from the cog.
+    """
+
+    def __init__(self, guild: discord.Guild):
+        # Built in reverse so that, like discord.utils.get, the first object with a given name wins
+        self.roles_by_name: Dict[str, discord.Role] = {r.name: r for r in reversed(guild.roles)}
+        self.channels_by_name: Dict[str, discord.TextChannel] = {c.name: c for c in reversed(guild.text_channels)}
+
+    # ----- Roles -----
+
+    def role_created(self, role: discord.Role):
+        self.roles_by_name.setdefault(role.name, role)
+
+    def role_deleted(self, role: discord.Role):
+        indexed = self.roles_by_name.get(role.name)
+        if indexed is not None and indexed.id == role.id:
+            del self.roles_by_name[role.name]
+
+    def role_updated(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            # discord.py mutates the cached role in place, so match by ID rather than identity
+            indexed = self.roles_by_name.get(before.name)
+            if indexed is not None and indexed.id == after.id:
+                del self.roles_by_name[before.name]
+            self.roles_by_name.setdefault(after.name, after)
+
+    # ----- Text channels -----
+
+    def channel_created(self, channel: discord.abc.GuildChannel):
+        if isinstance(channel, discord.TextChannel):
+            self.channels_by_name.setdefault(channel.name, channel)
+
+    def channel_deleted(self, channel: discord.abc.GuildChannel):
+        indexed = self.channels_by_name.get(channel.name)
+        if indexed is not None and indexed.id == channel.id:
+            del self.channels_by_name[channel.name]
+
+    def channel_updated(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        if isinstance(after, discord.TextChannel) and before.name != after.name:
+            indexed = self.channels_by_name.get(before.name)
+            if indexed is not None and indexed.id == after.id:
+                del self.channels_by_name[before.name]
+            self.channels_by_name.setdefault(after.name, after)
+
+
+_indexes: Dict[int, GuildNameIndex] = {}
+
+def get_index(guild: discord.Guild) -> GuildNameIndex:
+    """Returns the name index for a guild, building it on first use."""
+    index = _indexes.get(guild.id)
+    if index is None:
+        index = _indexes[guild.id] = GuildNameIndex(guild)
+    return index
+
+def peek_index(guild_id: int) -> Optional[GuildNameIndex]:
+    """Returns a guild's index only if it has already been built (event handlers don't build one)."""
+    return _indexes.get(guild_id)
+
+def drop_index(guild_id: int):
+    """Forgets a guild's index, e.g. when the bot leaves it."""
+    _indexes.pop(guild_id, None)
+
+def find_role(guild: discord.Guild, name: str) -> Optional[discord.Role]:
+    """O(1) role lookup by name, falling back to a scan (and re-indexing) if the entry is missing or stale."""
+    index = get_index(guild)
+    role = index.roles_by_name.get(name)
+    if role is not None and role.name == name and guild.get_role(role.id) is not None:
+        return role
+
+    role = discord.utils.get(guild.roles, name=name)
+    if role is not None:
+        index.roles_by_name[name] = role
+    else:
+        index.roles_by_name.pop(name, None)
+    return role
+
+def find_text_channel(guild: discord.Guild, name: str) -> Optional[discord.TextChannel]:
+    """O(1) text channel lookup by name, falling back to a scan (and re-indexing) if the entry is missing or stale."""
+    index = get_index(guild)
+    channel = index.channels_by_name.get(name)
+    if channel is not None and channel.name == name and guild.get_channel(channel.id) is not None:
+        return channel
+
+    channel = discord.utils.get(guild.text_channels, name=name)
+    if channel is not None:
+        index.channels_by_name[name] = channel
+    else:
+        index.channels_by_name.pop(name, None)
+    return channel
@@ -0,0 +1,45 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+class DiscordRateLimiter:
+    """
+    Paces bursts of Discord REST calls (role/channel mutations) for one guild.
+
+    Calls run with bounded concurrency and draw from a token bucket, so a single
+    guild's marathon start or end can't flood the API. Limiters are per guild, so
+    this is not a global cap: discord.py's HTTP client still owns the global
+    bucket and already retries 429 responses itself.
+    """
+
+    def __init__(self, concurrency: int = 5, rate: int = 45, per: float = 1.0):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._rate = rate
+        self._per = per
+        self._tokens = float(rate)
+        self._updated_at = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+
+    async def _acquire_token(self):
+        """Waits until the token bucket has room for one more request."""
+        async with self._bucket_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._rate, self._tokens + (now - self._updated_at) * self._rate / self._per)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self._per / self._rate)
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Runs a single Discord API call under the concurrency and rate limits."""
+        async with self._semaphore:
+            await self._acquire_token()
+            return await call()
+
+    async def run_all(self, calls: Iterable[Callable[[], Awaitable[T]]]) -> List[T | BaseException]:
+        """Runs several independent calls concurrently, returning results or exceptions in order."""
+        return await asyncio.gather(*(self.run(call) for call in calls), return_exceptions=True)
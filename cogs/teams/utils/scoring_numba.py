@@ -0,0 +1,93 @@
+"""
+Numeric kernels for team-formation scoring.
+
+When numba is installed the kernels are JIT-compiled (and cached on disk) so the
+pairwise loops run as native code; otherwise the equivalent NumPy implementations
+are used. Callers don't need to know which one is active.
+"""
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Timezone compatibility decays linearly to zero at this many hours apart
+TZ_DECAY_HOURS = 9.0
+
+
+def _pairwise_tz_scores_numpy(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    diff = np.abs(a[:, None] - b[None, :])
+    scores = np.clip(1.0 - diff / TZ_DECAY_HOURS, 0.0, 1.0)
+    scores[np.isnan(diff)] = 0.0
+    return scores
+
+
+def _similarity_bonus_score_numpy(values: np.ndarray, perfect_thr: float, perfect_bonus: float,
+                                  mid_low: float, mid_high: float, mid_inc: float, mid_cap: float) -> float:
+    perfect_matches = np.sum(values >= perfect_thr)
+    mid_matches = np.sum((values >= mid_low) & (values < mid_high))
+    bonus = perfect_matches * perfect_bonus + min(mid_cap, mid_matches * mid_inc)
+    return min(1.0, float(np.mean(values)) + bonus)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _pairwise_tz_scores_jit(a, b):
+        out = np.zeros((a.shape[0], b.shape[0]))
+        for i in range(a.shape[0]):
+            for j in range(b.shape[0]):
+                diff = abs(a[i] - b[j])
+                # NaN (unknown timezone) fails this comparison and keeps its 0.0
+                if diff < TZ_DECAY_HOURS:
+                    out[i, j] = 1.0 - diff / TZ_DECAY_HOURS
+        return out
+
+    @njit(cache=True, nogil=True)
+    def _similarity_bonus_score_jit(values, perfect_thr, perfect_bonus, mid_low, mid_high, mid_inc, mid_cap):
+        total = 0.0
+        perfect_matches = 0
+        mid_matches = 0
+        for v in values:
+            total += v
+            if v >= perfect_thr:
+                perfect_matches += 1
+            if mid_low <= v < mid_high:
+                mid_matches += 1
+        bonus = perfect_matches * perfect_bonus + min(mid_cap, mid_matches * mid_inc)
+        return min(1.0, total / values.shape[0] + bonus)
+
+
+def pairwise_tz_scores(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Returns the len(a) x len(b) timezone compatibility matrix for two offset arrays (NaN = unknown)."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _pairwise_tz_scores_jit(a, b)
+    return _pairwise_tz_scores_numpy(a, b)
+
+
+def similarity_bonus_score(matrix: np.ndarray, perfect_thr: float, perfect_bonus: float,
+                           mid_low: float, mid_high: float, mid_inc: float, mid_cap: float) -> float:
+    """Mean similarity plus the perfect-match and capped mid-range bonuses, clamped to 1.0."""
+    values = np.ascontiguousarray(matrix, dtype=np.float64).ravel()
+    if NUMBA_AVAILABLE:
+        return _similarity_bonus_score_jit(values, perfect_thr, perfect_bonus, mid_low, mid_high, mid_inc, mid_cap)
+    return _similarity_bonus_score_numpy(values, perfect_thr, perfect_bonus, mid_low, mid_high, mid_inc, mid_cap)
+
+
+def warm_up():
+    """Triggers JIT compilation up front so the first formation request doesn't pay for it."""
+    if not NUMBA_AVAILABLE:
+        return
+    sample = np.array([0.0, np.nan])
+    pairwise_tz_scores(sample, sample)
+    similarity_bonus_score(np.array([[0.5, 1.0]]), 0.95, 0.25, 0.7, 0.95, 0.05, 0.2)
+    logger.info("Numba scoring kernels compiled.")
+
+
+warm_up()
@@ -1,11 +1,16 @@
+import asyncio
 import discord
 import logging
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ..models.team import Team, TeamMember, TeamError
+from .name_index import get_index, find_role, find_text_channel
 
 logger = logging.getLogger(__name__)
 
+# Role assignments allowed in flight at once when provisioning a team
+ROLE_ASSIGN_CONCURRENCY = 5
+
 async def fetch_member_safely(guild: discord.Guild, user_id: str) -> Optional[discord.Member]:
     """Safely fetches a member from the guild by ID, returning None if not found."""
     try:
@@ -15,30 +20,75 @@ async def fetch_member_safely(guild: discord.Guild, user_id: str) -> Optional[di
         logger.warning(f"Could not fetch member {user_id}: {e}")
         return None
 
+async def fetch_members_safely(guild: discord.Guild, user_ids: Iterable[str]) -> Dict[str, Optional[discord.Member]]:
+    """
+    Resolves several members at once. Cached members are returned directly and only
+    cache misses go to the API, concurrently rather than one round-trip at a time.
+    """
+    members = {uid: guild.get_member(int(uid)) if uid.isdecimal() else None for uid in user_ids}
+    missing = [uid for uid, member in members.items() if member is None]
+    if missing:
+        fetched = await asyncio.gather(*(fetch_member_safely(guild, uid) for uid in missing))
+        members.update(zip(missing, fetched))
+    return members
+
 def get_member_role_title(member: discord.Member) -> str:
     """Determines a member's role title based on their Discord roles."""
-    roles = {role.name for role in member.roles}
-    if "Team Leader" in roles:
-        return "Team Leader"
-    if "Team Member" in roles:
-        return "Team Member"
-    return "Unregistered"
+    # Single pass without building a name set; "Team Leader" wins as soon as it is seen
+    has_member_role = False
+    for role in member.roles:
+        name = role.name
+        if name == "Team Leader":
+            return "Team Leader"
+        if name == "Team Member":
+            has_member_role = True
+    return "Team Member" if has_member_role else "Unregistered"
 
 def build_team_from_data(guild_id: int, team_data: Dict) -> Team:
     """Builds a Team object from a database document."""
-    members = {uid: TeamMember(**data) for uid, data in team_data.get("members", {}).items()}
+    # Positional construction skips **kwargs binding for every stored member
+    members = {
+        uid: TeamMember(
+            data["user_id"], data["username"], data["display_name"],
+            data.get("role_title", "Unregistered"), data.get("profile_data", {})
+        )
+        for uid, data in team_data.get("members", {}).items()
+    }
     return Team(
         guild_id=guild_id,
         team_role=team_data["team_role"],
         channel_name=team_data["channel_name"],
         members=members,
-        _team_number=team_data.get("team_number")
+        _team_number=team_data.get("team_number"),
+        channel_id=team_data.get("channel_id")
     )
 
+async def assign_role_bounded(members: Iterable[discord.Member], role: discord.Role, reason: str,
+                              concurrency: int = ROLE_ASSIGN_CONCURRENCY) -> List[Tuple[discord.Member, discord.HTTPException]]:
+    """
+    Adds a role to several members concurrently, with at most `concurrency` requests
+    in flight. A failed assignment doesn't cancel the others; failures are returned
+    as (member, error) pairs for the caller to report.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = []
+
+    async def assign(member: discord.Member):
+        async with semaphore:
+            try:
+                await member.add_roles(role, reason=reason)
+            except discord.HTTPException as e:
+                failures.append((member, e))
+
+    async with asyncio.TaskGroup() as tg:
+        for member in members:
+            tg.create_task(assign(member))
+    return failures
+
 async def cleanup_team_discord_resources(guild: discord.Guild, team: Team):
     """Cleans up Discord roles and channels for a deleted team."""
     # Remove team role
-    role = discord.utils.get(guild.roles, name=team.team_role)
+    role = find_role(guild, team.team_role)
     if role:
         try:
             await role.delete(reason=f"Team {team.team_role} deleted")
@@ -47,7 +97,7 @@ async def cleanup_team_discord_resources(guild: discord.Guild, team: Team):
             logger.error(f"Failed to delete role '{team.team_role}': {e}")
 
     # Remove team channel
-    channel = discord.utils.get(guild.text_channels, name=team.channel_name)
+    channel = find_text_channel(guild, team.channel_name)
     if channel:
         try:
             await channel.delete(reason=f"Team {team.team_role} deleted")
@@ -56,37 +106,47 @@ async def cleanup_team_discord_resources(guild: discord.Guild, team: Team):
             logger.error(f"Failed to delete channel '#{team.channel_name}': {e}")
 
 async def provision_team_resources(guild: discord.Guild, team: Team):
-    """Provisions Discord role and channel for a team."""
+    """
+    Provisions Discord role and channel for a team. Anything created is added to the
+    guild's name index right away, so later teams in the same batch see it without
+    waiting for the gateway event.
+    """
+    index = get_index(guild)
     try:
-        role = discord.utils.get(guild.roles, name=team.team_role) or await guild.create_role(name=team.team_role, reason=f"Provisioning for {team.team_role}")
+        role = find_role(guild, team.team_role)
+        if not role:
+            role = await guild.create_role(name=team.team_role, reason=f"Provisioning for {team.team_role}")
+            index.role_created(role)
 
-        for user_id in team.members:
-            member = await fetch_member_safely(guild, user_id)
-            if member and role not in member.roles:
-                await member.add_roles(role, reason="Team assignment")
+        members = await fetch_members_safely(guild, team.members)
+        failures = await assign_role_bounded(
+            (member for member in members.values() if member and role not in member.roles), role, "Team assignment"
+        )
+        if failures:
+            raise failures[0][1]
 
-        channel = discord.utils.get(guild.text_channels, name=team.channel_name.lower())
+        channel = find_text_channel(guild, team.channel_name.lower())
         if not channel:
             overwrites = {
                 guild.default_role: discord.PermissionOverwrite(view_channel=False),
                 role: discord.PermissionOverwrite(view_channel=True)
             }
-            await guild.create_text_channel(team.channel_name, overwrites=overwrites)
+            channel = await guild.create_text_channel(team.channel_name, overwrites=overwrites)
+            index.channel_created(channel)
     except (discord.Forbidden, discord.HTTPException) as e:
         logger.error(f"Failed to provision resources for {team.team_role}: {e}")
         raise TeamError(f"Failed to create Discord resources for {team.team_role}.")
 
 async def provision_roles_for_new_members(guild: discord.Guild, team_name: str, new_members: list[TeamMember]):
     """Assigns the team role to newly added members."""
-    role = discord.utils.get(guild.roles, name=team_name)
+    role = find_role(guild, team_name)
     if not role:
         logger.warning(f"Team role '{team_name}' not found when adding new members.")
         return
 
-    for team_member in new_members:
-        member = await fetch_member_safely(guild, team_member.user_id)
-        if member and role not in member.roles:
-            try:
-                await member.add_roles(role, reason=f"Added to {team_name}")
-            except (discord.Forbidden, discord.HTTPException) as e:
-                logger.error(f"Failed to assign role to {member.display_name}: {e}")
+    members = await fetch_members_safely(guild, (team_member.user_id for team_member in new_members))
+    failures = await assign_role_bounded(
+        (member for member in members.values() if member and role not in member.roles), role, f"Added to {team_name}"
+    )
+    for member, error in failures:
+        logger.error(f"Failed to assign role to {member.display_name}: {error}")
@@ -1,26 +1,43 @@
 import re
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Optional
+import numpy as np
+from .scoring_numba import TZ_DECAY_HOURS, pairwise_tz_scores
+
+# Multiplying by the reciprocal avoids a float divide per scored pair
+_INV_DECAY_HOURS = 1.0 / TZ_DECAY_HOURS
 
 class TimezoneProcessor:
     """Handles parsing and compatibility scoring for timezones."""
     # This map is now the single source of truth for timezones.
-    TIMEZONE_MAP = {
+    # Read-only: the memoized parser caches results derived from it.
+    TIMEZONE_MAP = MappingProxyType({
         "EST": -5, "EDT": -4, "CST": -6, "CDT": -5, "MST": -7, "MDT": -6,
         "PST": -8, "PDT": -7, "AKST": -9, "AKDT": -8, "HST": -10, "GMT": 0,
         "UTC": 0, "CET": 1, "CEST": 2, "EET": 2, "EEST": 3, "IST": 5.5,
         "JST": 9, "AEST": 10, "AEDT": 11,
-    }
+    })
+    _OFFSET_RE = re.compile(r"(?:UTC|GMT)\s?([+-])(\d{1,2})(?::(\d{2}))?")
 
     def parse_to_utc_offset(self, tz_string: str) -> Optional[float]:
         """Parses a timezone string (abbreviation or UTC/GMT offset) to a float offset."""
         if not isinstance(tz_string, str):
             return None
+        return self._parse_upper(tz_string.upper().strip())
 
-        tz_upper = tz_string.upper().strip()
-        if tz_upper in self.TIMEZONE_MAP:
-            return self.TIMEZONE_MAP[tz_upper]
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_upper(tz_upper: str) -> Optional[float]:
+        """
+        Parses an already upper-cased and stripped timezone string, without type checks.
+        Memoized: pairwise scoring parses the same handful of profile strings over and over.
+        """
+        offset = TimezoneProcessor.TIMEZONE_MAP.get(tz_upper)
+        if offset is not None:
+            return offset
 
-        match = re.match(r"(?:UTC|GMT)\s?([+-])(\d{1,2})(?::(\d{2}))?", tz_upper)
+        match = TimezoneProcessor._OFFSET_RE.match(tz_upper)
         if match:
             sign, hours, minutes = match.groups()
             offset = float(hours) + (float(minutes) / 60.0 if minutes else 0.0)
@@ -32,9 +49,28 @@ class TimezoneProcessor:
         """Calculates timezone compatibility using a linear decay model (0-9 hours)."""
         if tz_offset1 is None or tz_offset2 is None:
             return 0.0
+        # Most scored pairs share a timezone
+        if tz_offset1 == tz_offset2:
+            return 1.0
         hour_diff = abs(tz_offset1 - tz_offset2)
         # Score is 1.0 for 0 diff, decaying to 0.0 for >= 9 hours diff.
-        return max(0.0, 1.0 - (hour_diff / 9.0))
+        if hour_diff >= TZ_DECAY_HOURS:
+            return 0.0
+        return 1.0 - hour_diff * _INV_DECAY_HOURS
+
+    def vectorize(self, tz_strings: Iterable[Optional[str]]) -> np.ndarray:
+        """Parses timezone strings into an offset array, with NaN where a string can't be parsed."""
+        # Validate and normalise each string once here, so the parse and the numeric kernel never type-check
+        offsets = (self._parse_upper(tz.upper().strip()) if isinstance(tz, str) else None for tz in tz_strings)
+        return np.array([np.nan if offset is None else offset for offset in offsets], dtype=np.float64)
+
+    @staticmethod
+    def pairwise_compat(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_compatibility: returns the len(a) x len(b) matrix of
+        scores between two offset arrays, scoring 0.0 wherever either side is unknown.
+        """
+        return pairwise_tz_scores(a, b)
 
 if __name__ == "__main__":
     timezones = ", ".join(f'"{tz}"' for tz in TimezoneProcessor.TIMEZONE_MAP.keys())
@@ -101,15 +101,29 @@ AI_TIMEOUT = int(os.getenv("AI_TIMEOUT", 30))
 # --- Team & Server Configuration ---
 REACTION_EMOJI=os.getenv("REACTION_EMOJI", "✅")
 COMMUNICATION_CHANNEL_ID = int(os.getenv("COMMUNICATION_CHANNEL_ID", 0))
-MODERATOR_ROLES = [role.strip() for role in os.getenv("MODERATOR_ROLES", "").split(",")]
-EXCLUDED_TEAM_ROLES = [role.strip() for role in os.getenv("EXCLUDED_TEAM_ROLES", "").split(",")]
+# Parsed once into frozensets for O(1) role-name membership checks; blank entries are dropped
+MODERATOR_ROLES = frozenset(role.strip() for role in os.getenv("MODERATOR_ROLES", "").split(",") if role.strip())
+EXCLUDED_TEAM_ROLES = frozenset(role.strip() for role in os.getenv("EXCLUDED_TEAM_ROLES", "").split(",") if role.strip())
 MAX_TEAM_SIZE = int(os.getenv("MAX_TEAM_SIZE", 12))
 MAX_LEADERS_PER_TEAM = int(os.getenv("MAX_LEADERS_PER_TEAM", 2))
 
+# --- Database Connection ---
+MONGO_MAX_POOL_SIZE=int(os.getenv("MONGO_MAX_POOL_SIZE", 50))
+MONGO_MIN_POOL_SIZE=int(os.getenv("MONGO_MIN_POOL_SIZE", 10))
+# zlib ships with Python; "zstd" and "snappy" need the zstandard / python-snappy packages
+MONGO_COMPRESSORS=os.getenv("MONGO_COMPRESSORS", "zlib")
+MONGO_SERVER_SELECTION_TIMEOUT_MS=int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000))
+
 # --- Database Collection Names ---
 SETTINGS_COLLECTION=os.getenv("SETTINGS_COLLECTION", "settings")
-TEAMS_COLLECTION =os.getenv("TEAMS_COLLECTION ", "teams")
+TEAMS_COLLECTION=os.getenv("TEAMS_COLLECTION", "teams")
 UNREGISTERED_MEMBERS_COLLECTION=os.getenv("UNREGISTERED_MEMBERS_COLLECTION", "unregistered_members")
+TEAM_MEMBERS_INDEX_COLLECTION=os.getenv("TEAM_MEMBERS_INDEX_COLLECTION", "team_members_index")
+
+# --- Caching ---
+TEAMS_CACHE_TTL=float(os.getenv("TEAMS_CACHE_TTL", 30))
+UNREGISTERED_CACHE_TTL=float(os.getenv("UNREGISTERED_CACHE_TTL", 10))
+SETTINGS_CACHE_TTL=float(os.getenv("SETTINGS_CACHE_TTL", 30))
 
 # --- Scoring Engine Parameters ---
 PERFECT_MATCH_THRESHOLD=float(os.getenv("PERFECT_MATCH_THRESHOLD", 0.95))
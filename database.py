@@ -1,11 +1,32 @@
+import asyncio
 import logging
-from typing import Optional, Dict, List, Any
+import time
+from collections import defaultdict
+from typing import Optional, Dict, List, Any, AsyncIterator, Iterable, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import PyMongoError
 from datetime import datetime
-from config import DB_NAME, TEAMS_COLLECTION, UNREGISTERED_MEMBERS_COLLECTION, SETTINGS_COLLECTION, DEFAULT_AI_MODEL
+from config import (
+    DB_NAME, TEAMS_COLLECTION, UNREGISTERED_MEMBERS_COLLECTION, SETTINGS_COLLECTION,
+    TEAM_MEMBERS_INDEX_COLLECTION, DEFAULT_AI_MODEL, TEAMS_CACHE_TTL, UNREGISTERED_CACHE_TTL, SETTINGS_CACHE_TTL,
+    MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_COMPRESSORS, MONGO_SERVER_SELECTION_TIMEOUT_MS
+)
 
 logger = logging.getLogger(__name__)
 
+# Cached stand-in for a guild without an unregistered document; shared, so never mutate it
+_EMPTY_DOC: Dict[str, Any] = {"leaders": {}, "members": {}}
+
+# Default projection: no caller uses the ObjectId, so don't ship or decode it
+_NO_ID = {"_id": 0}
+
+# Documents per cursor batch when reading a guild's teams, so fetching overlaps with decoding
+TEAMS_BATCH_SIZE = 50
+
+# The settings fields read on hot command paths; the settings cache holds only these
+_SETTINGS_PROJECTION = {"ai_model": 1, "team_panel": 1, "marathon_state": 1, "_id": 0}
+
 class TeamDatabaseManager:
     """
     Manages all database interactions for the bot, using a unified 'settings'
@@ -13,201 +34,429 @@ class TeamDatabaseManager:
     """
     def __init__(self, uri: str, db_name: str = DB_NAME):
         """Initializes the database client and collections."""
-        self.client = AsyncIOMotorClient(uri)
+        # Keep a few connections warm for the many small per-command queries
+        self.client = AsyncIOMotorClient(
+            uri,
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            compressors=MONGO_COMPRESSORS,
+            serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            retryWrites=True
+        )
         self.db = self.client[db_name]
         self.teams = self.db[TEAMS_COLLECTION]
         self.settings = self.db[SETTINGS_COLLECTION]
         self.unregistered = self.db[UNREGISTERED_MEMBERS_COLLECTION]
+        # Inverted (guild_id, user_id) -> team_role index, kept in sync with team writes
+        self.member_index = self.db[TEAM_MEMBERS_INDEX_COLLECTION]
+        # Short-lived per-guild cache of team documents, invalidated on every team write
+        self._teams_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._teams_cache_generation: Dict[int, int] = defaultdict(int)
+        self._teams_cache_locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Short-lived per-guild cache of the unregistered members document, invalidated on every write
+        self._unregistered_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._unregistered_cache_generation: Dict[int, int] = defaultdict(int)
+        # Per-guild cache of the hot settings fields, invalidated on every settings write
+        self._settings_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._settings_cache_generation: Dict[int, int] = defaultdict(int)
         logger.info("Database manager initialized with unified settings collection.")
 
+    async def ensure_indexes(self):
+        """
+        Creates the indexes the bot relies on and backfills the member index if it is empty.
+        Each index is created independently, so one failure (e.g. duplicates in old data) doesn't block the rest.
+        """
+        # The member index comes first: member-conflict checks return nothing without it
+        await self._create_index(self.member_index, [("guild_id", ASCENDING), ("user_id", ASCENDING)], unique=True)
+        await self._create_index(self.member_index, [("guild_id", ASCENDING), ("team_role", ASCENDING)])
+        try:
+            if await self.member_index.estimated_document_count() == 0:
+                async for team in self.iter_teams(projection={"guild_id": 1, "team_role": 1, "members": 1, "_id": 0}):
+                    await self._sync_member_index(team["guild_id"], team["team_role"], team.get("members", {}).keys())
+        except PyMongoError as e:
+            logger.error("Could not backfill the team member index: %s", e)
+
+        # Every team query is scoped to a guild and then narrowed by role name or sorted by number
+        if not await self._create_index(self.teams, [("guild_id", ASCENDING), ("team_role", ASCENDING)], unique=True):
+            # Older data may hold duplicate teams; say which ones need merging
+            await self._log_duplicate_teams()
+        await self._create_index(self.teams, [("guild_id", ASCENDING), ("team_number", DESCENDING)])
+        # Settings and unregistered members are one document per guild, upserted by guild_id
+        await self._create_index(self.settings, [("guild_id", ASCENDING)], unique=True)
+        await self._create_index(self.unregistered, [("guild_id", ASCENDING)], unique=True)
+
+    async def _create_index(self, collection, keys: List[Tuple[str, int]], **kwargs) -> bool:
+        """Creates one index, logging instead of raising on failure. Returns whether it succeeded."""
+        try:
+            await collection.create_index(keys, **kwargs)
+            return True
+        except PyMongoError as e:
+            logger.error("Could not create index %s on %s: %s", keys, collection.name, e)
+            return False
+
+    async def _log_duplicate_teams(self):
+        """Logs every (guild_id, team_role) pair that has more than one team document."""
+        pipeline = [
+            {"$group": {"_id": {"guild_id": "$guild_id", "team_role": "$team_role"}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}}
+        ]
+        try:
+            async for dup in self.teams.aggregate(pipeline):
+                logger.error(
+                    "Duplicate team '%s' in guild %s (%s documents).",
+                    dup["_id"]["team_role"], dup["_id"]["guild_id"], dup["count"]
+                )
+        except PyMongoError as e:
+            logger.error("Could not look up duplicate teams: %s", e)
+
     # ========== GENERIC CRUD OPERATIONS ==========
 
     async def _update_document(self, collection, filter_query: Dict, update_data: Dict, upsert: bool = False):
-        """Generic method to update a single document."""
-        update_query = {"$set": {**update_data, "updated_at": datetime.utcnow()}}
+        """Generic method to update a single document, stamping updated_at with the server's clock."""
+        update_query = {"$set": update_data, "$currentDate": {"updated_at": True}}
         return await collection.update_one(filter_query, update_query, upsert=upsert)
 
     async def _update_many_documents(self, collection, filter_query: Dict, update_data: Dict):
-        """Generic method to update multiple documents."""
-        update_query = {"$set": {**update_data, "updated_at": datetime.utcnow()}}
+        """Generic method to update multiple documents, stamping updated_at with the server's clock."""
+        update_query = {"$set": update_data, "$currentDate": {"updated_at": True}}
         return await collection.update_many(filter_query, update_query)
 
-    async def _find_document(self, collection, filter_query: Dict) -> Optional[Dict[str, Any]]:
-        """Generic method to find a single document."""
-        return await collection.find_one(filter_query)
+    async def _find_document(self, collection, filter_query: Dict, projection: Dict = _NO_ID) -> Optional[Dict[str, Any]]:
+        """Generic method to find a single document, optionally returning only the projected fields (never _id by default)."""
+        return await collection.find_one(filter_query, projection)
 
-    async def _find_documents(self, collection, filter_query: Dict) -> List[Dict[str, Any]]:
-        """Generic method to find multiple documents."""
-        cursor = collection.find(filter_query)
+    async def _find_documents(self, collection, filter_query: Dict, batch_size: int = 0) -> List[Dict[str, Any]]:
+        """Generic method to find multiple documents, without _id. A batch_size of 0 leaves batching to the server."""
+        cursor = collection.find(filter_query, _NO_ID, batch_size=batch_size)
         return await cursor.to_list(length=None)
 
     async def _delete_document(self, collection, filter_query: Dict):
         """Generic method to delete a single document."""
         return await collection.delete_one(filter_query)
 
+    # ========== TEAM MEMBER INDEX ==========
+
+    async def _sync_member_index(self, guild_id: int, team_role: str, member_ids: Iterable[str]):
+        """Points every given member at the team and drops stale entries for members no longer in it."""
+        member_ids = list(member_ids)
+        await self.member_index.delete_many({"guild_id": guild_id, "team_role": team_role, "user_id": {"$nin": member_ids}})
+        if member_ids:
+            await self.member_index.bulk_write([
+                UpdateOne({"guild_id": guild_id, "user_id": uid}, {"$set": {"team_role": team_role}}, upsert=True)
+                for uid in member_ids
+            ], ordered=False)
+
     # ========== TEAM MANAGEMENT ==========
 
+    def _get_cached_teams(self, guild_id: int) -> Optional[List[Dict[str, Any]]]:
+        cached = self._teams_cache.get(guild_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def invalidate_teams_cache(self, guild_id: int):
+        """Drops the cached teams for a guild so the next read goes to the database."""
+        self._teams_cache.pop(guild_id, None)
+        self._teams_cache_generation[guild_id] += 1
+
     async def get_teams(self, guild_id: int) -> List[Dict[str, Any]]:
-        """Retrieves all teams for a given guild."""
-        return await self._find_documents(self.teams, {"guild_id": guild_id})
+        """Retrieves all teams for a given guild, served from a short-lived cache."""
+        teams = self._get_cached_teams(guild_id)
+        if teams is not None:
+            return teams
+
+        # Concurrent misses for the same guild wait for a single database read
+        async with self._teams_cache_locks[guild_id]:
+            teams = self._get_cached_teams(guild_id)
+            if teams is not None:
+                return teams
+
+            generation = self._teams_cache_generation[guild_id]
+            teams = await self._find_documents(self.teams, {"guild_id": guild_id}, batch_size=TEAMS_BATCH_SIZE)
+            # Don't cache a result that a write invalidated while it was in flight
+            if generation == self._teams_cache_generation[guild_id]:
+                self._teams_cache[guild_id] = (time.monotonic() + TEAMS_CACHE_TTL, teams)
+            return teams
+
+    async def iter_teams(self, guild_id: Optional[int] = None, projection: Dict = _NO_ID) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streams teams straight from the database in batches, bypassing the cache: one guild's,
+        or every guild's when guild_id is None. For one-pass scans that shouldn't hold every
+        team document in memory at once.
+        """
+        filter_query = {} if guild_id is None else {"guild_id": guild_id}
+        async for team in self.teams.find(filter_query, projection, batch_size=TEAMS_BATCH_SIZE):
+            yield team
 
     async def get_team_by_name(self, guild_id: int, team_name: str) -> Optional[Dict[str, Any]]:
         """Retrieves a specific team by its role name."""
         return await self._find_document(self.teams, {"guild_id": guild_id, "team_role": team_name})
 
     async def insert_team(self, team_data: Dict[str, Any]):
-        """Creates a new team document."""
-        team_data.update({
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        })
-        return await self.teams.insert_one(team_data)
+        """Creates a new team document. Raises DuplicateKeyError (via the unique team index) if the team already exists."""
+        now = datetime.utcnow()
+        # Insert a stamped copy so the caller's dict isn't mutated
+        result = await self.teams.insert_one({**team_data, "created_at": now, "updated_at": now})
+        self.invalidate_teams_cache(team_data["guild_id"])
+        await self._sync_member_index(team_data["guild_id"], team_data["team_role"], team_data.get("members", {}).keys())
+        return result
 
     async def delete_team(self, guild_id: int, team_role: str):
         """Deletes a team document."""
-        return await self._delete_document(self.teams, {"guild_id": guild_id, "team_role": team_role})
+        result = await self._delete_document(self.teams, {"guild_id": guild_id, "team_role": team_role})
+        self.invalidate_teams_cache(guild_id)
+        await self.member_index.delete_many({"guild_id": guild_id, "team_role": team_role})
+        return result
 
     async def update_team_field(self, guild_id: int, team_role: str, field: str, value: Any):
         """Updates a specific field of a team document."""
-        return await self._update_document(self.teams, {"guild_id": guild_id, "team_role": team_role}, {field: value})
+        result = await self._update_document(self.teams, {"guild_id": guild_id, "team_role": team_role}, {field: value})
+        self.invalidate_teams_cache(guild_id)
+        return result
 
     async def update_team_members(self, guild_id: int, team_role: str, members_dict: Dict[str, Any]):
         """Convenience method to update all members of a team."""
-        return await self.update_team_field(guild_id, team_role, "members", members_dict)
+        result = await self.update_team_field(guild_id, team_role, "members", members_dict)
+        await self._sync_member_index(guild_id, team_role, members_dict.keys())
+        return result
 
     async def update_member_in_teams(self, guild_id: int, user_id: str, updates: Dict[str, Any]):
-        """Updates specific fields for a member across all teams they might be in."""
+        """Updates specific fields for a member across all teams they might be in. Returns None if there's nothing to update."""
+        if not updates:
+            return None
+
         filter_query = {"guild_id": guild_id, f"members.{user_id}": {"$exists": True}}
         update_data = {f"members.{user_id}.{k}": v for k, v in updates.items()}
-        return await self._update_many_documents(self.teams, filter_query, update_data)
+        result = await self.teams.update_many(filter_query, {"$set": update_data, "$currentDate": {"updated_at": True}})
+        self.invalidate_teams_cache(guild_id)
+        return result
 
-    async def find_team_by_member(self, guild_id: int, user_id: str) -> Optional[dict]:
-        """Finds the team document that contains a specific member ID."""
-        return await self._find_document(self.teams, {"guild_id": guild_id, f"members.{user_id}": {"$exists": True}})
+    async def find_teams_by_members(self, guild_id: int, user_ids: Iterable[str]) -> Dict[str, str]:
+        """Maps each of the given member IDs that is in a team to its team role, in a single query."""
+        entries = await self._find_documents(self.member_index, {"guild_id": guild_id, "user_id": {"$in": list(user_ids)}})
+        return {entry["user_id"]: entry["team_role"] for entry in entries}
 
     async def get_max_team_number(self, guild_id: int) -> int:
         """Finds the highest team_number for a guild for efficient numbering."""
-        highest_team = await self.teams.find_one({"guild_id": guild_id}, sort=[("team_number", -1)])
+        highest_team = await self.teams.find_one({"guild_id": guild_id}, {"team_number": 1, "_id": 0}, sort=[("team_number", DESCENDING)])
         return highest_team.get("team_number", 0) if highest_team else 0
 
     async def update_team_channel_name(self, guild_id: int, team_name: str, new_channel_name: str):
         """Updates the channel name for a specific team."""
         return await self.update_team_field(guild_id, team_name, "channel_name", new_channel_name)
 
+    async def update_team_channel_id(self, guild_id: int, team_name: str, channel_id: int):
+        """Stores the Discord channel ID for a specific team so it can be resolved without a name scan."""
+        return await self.update_team_field(guild_id, team_name, "channel_id", channel_id)
+
+    # ========== SETTINGS CACHE ==========
+
+    def invalidate_settings_cache(self, guild_id: int):
+        """Drops the cached settings for a guild so the next read goes to the database."""
+        self._settings_cache.pop(guild_id, None)
+        self._settings_cache_generation[guild_id] += 1
+
+    async def _get_settings_cached(self, guild_id: int) -> Dict[str, Any]:
+        """
+        Retrieves the hot settings fields for a guild, served from a short-lived cache.
+        A guild without a settings document yields an empty dict. The result is shared,
+        so treat it as read-only.
+        """
+        cached = self._settings_cache.get(guild_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        generation = self._settings_cache_generation[guild_id]
+        doc = await self._find_document(self.settings, {"guild_id": guild_id}, _SETTINGS_PROJECTION) or {}
+        # Don't cache a result that a write invalidated while it was in flight
+        if generation == self._settings_cache_generation[guild_id]:
+            self._settings_cache[guild_id] = (time.monotonic() + SETTINGS_CACHE_TTL, doc)
+        return doc
+
+    async def delete_guild_settings(self, guild_id: int):
+        """
+        Deletes a guild's settings document (panel, marathon state, AI model), e.g. once the bot has left it.
+        Team and unregistered member data are kept, so a re-invited bot finds the guild's roster intact.
+        """
+        result = await self._delete_document(self.settings, {"guild_id": guild_id})
+        self.invalidate_settings_cache(guild_id)
+        return result
+
     # ========== SETTINGS: AI MODEL ==========
 
     async def get_active_ai_model(self, guild_id: int) -> str:
         """Retrieves the active AI model for the guild, returning the default if not set."""
-        settings_doc = await self._find_document(self.settings, {"guild_id": guild_id})
-        if settings_doc and "ai_model" in settings_doc:
+        settings_doc = await self._get_settings_cached(guild_id)
+        if "ai_model" in settings_doc:
             return settings_doc["ai_model"]
         return DEFAULT_AI_MODEL
 
     async def set_active_ai_model(self, guild_id: int, model_name: str):
         """Sets the active AI model for the guild."""
-        return await self._update_document(
+        result = await self._update_document(
             self.settings,
             {"guild_id": guild_id},
             {"ai_model": model_name},
             upsert=True
         )
+        self.invalidate_settings_cache(guild_id)
+        return result
 
     # ========== SETTINGS: TEAM PANEL ==========
 
     async def save_team_panel(self, guild_id: int, channel_id: int, message_id: int):
         """Saves or updates the team panel info within the guild's settings document."""
         panel_data = {"channel_id": channel_id, "message_id": message_id}
-        return await self._update_document(
+        result = await self._update_document(
             self.settings,
             {"guild_id": guild_id},
             {"team_panel": panel_data},
             upsert=True
         )
+        self.invalidate_settings_cache(guild_id)
+        return result
 
     async def get_team_panel(self, guild_id: int) -> Optional[Dict[str, Any]]:
         """Retrieves the team panel object from the guild's settings document."""
-        settings_doc = await self._find_document(self.settings, {"guild_id": guild_id})
-        return settings_doc.get("team_panel") if settings_doc else None
+        settings_doc = await self._get_settings_cached(guild_id)
+        return settings_doc.get("team_panel")
 
     async def delete_team_panel(self, guild_id: int):
         """Deletes the team panel object from the guild's settings document."""
-        return await self.settings.update_one(
+        result = await self.settings.update_one(
             {"guild_id": guild_id},
-            {"$unset": {"team_panel": ""}, "$set": {"updated_at": datetime.utcnow()}}
+            {"$unset": {"team_panel": ""}, "$currentDate": {"updated_at": True}}
         )
+        self.invalidate_settings_cache(guild_id)
+        return result
 
     # ========== SETTINGS: MARATHON STATE ==========
 
     async def get_marathon_state(self, guild_id: int) -> bool:
         """Retrieves the marathon's active status from the guild's settings document."""
-        settings_doc = await self._find_document(self.settings, {"guild_id": guild_id})
-        if settings_doc and "marathon_state" in settings_doc:
+        settings_doc = await self._get_settings_cached(guild_id)
+        if "marathon_state" in settings_doc:
             return settings_doc["marathon_state"].get("is_active", False)
         return False
 
     async def set_marathon_state(self, guild_id: int, is_active: bool) -> bool:
         """Sets the marathon state within the guild's settings document."""
+        return await self.set_and_get_marathon_state(guild_id, is_active) == is_active
+
+    async def set_and_get_marathon_state(self, guild_id: int, is_active: bool) -> bool:
+        """
+        Sets the marathon state and returns the stored is_active flag in the same round-trip.
+        The returned settings also refill the settings cache, so follow-up reads don't hit the database.
+        """
         state_data = {
             "is_active": is_active,
             "last_changed": datetime.utcnow()
         }
-        result = await self._update_document(
-            self.settings,
+        self.invalidate_settings_cache(guild_id)
+        generation = self._settings_cache_generation[guild_id]
+        settings_doc = await self.settings.find_one_and_update(
             {"guild_id": guild_id},
-            {"marathon_state": state_data},
-            upsert=True
-        )
-        return result.modified_count > 0 or result.upserted_id is not None
+            {"$set": {"marathon_state": state_data}, "$currentDate": {"updated_at": True}},
+            projection=_SETTINGS_PROJECTION,
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        ) or {}
+        # Don't cache the read-back if another settings write invalidated it while this was in flight
+        if generation == self._settings_cache_generation[guild_id]:
+            self._settings_cache[guild_id] = (time.monotonic() + SETTINGS_CACHE_TTL, settings_doc)
+        return settings_doc.get("marathon_state", {}).get("is_active", False)
 
     async def get_marathon_state_document(self, guild_id: int) -> Optional[Dict[str, Any]]:
         """Retrieves the marathon state object from the guild's settings document."""
-        settings_doc = await self._find_document(self.settings, {"guild_id": guild_id})
-        return settings_doc.get("marathon_state") if settings_doc else None
+        settings_doc = await self._get_settings_cached(guild_id)
+        return settings_doc.get("marathon_state")
 
     # ========== UNREGISTERED MEMBER MANAGEMENT ==========
 
-    async def get_unregistered_document(self, guild_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieves the single document containing all unregistered members for a guild."""
-        return await self._find_document(self.unregistered, {"guild_id": guild_id})
+    def invalidate_unregistered_cache(self, guild_id: int):
+        """Drops the cached unregistered document for a guild so the next read goes to the database."""
+        self._unregistered_cache.pop(guild_id, None)
+        self._unregistered_cache_generation[guild_id] += 1
+
+    async def get_unregistered_document(self, guild_id: int) -> Dict[str, Any]:
+        """
+        Retrieves the single document containing all unregistered members for a guild,
+        served from a short-lived cache. A guild without a document yields an empty
+        leaders/members document. The result is shared, so treat it as read-only.
+        """
+        cached = self._unregistered_cache.get(guild_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        generation = self._unregistered_cache_generation[guild_id]
+        doc = await self._find_document(self.unregistered, {"guild_id": guild_id}) or _EMPTY_DOC
+        # Don't cache a result that a write invalidated while it was in flight
+        if generation == self._unregistered_cache_generation[guild_id]:
+            self._unregistered_cache[guild_id] = (time.monotonic() + UNREGISTERED_CACHE_TTL, doc)
+        return doc
 
     async def save_unregistered_member(self, guild_id: int, user_id: str, member_data: Dict, role_type: str):
         """Saves or updates an unregistered member's data in the correct category (leaders/members)."""
         if role_type not in ["leaders", "members"]:
             raise ValueError("role_type must be 'leaders' or 'members'")
 
-        return await self._update_document(
+        result = await self._update_document(
             self.unregistered,
             {"guild_id": guild_id},
             {f"{role_type}.{user_id}": member_data},
             upsert=True
         )
+        self.invalidate_unregistered_cache(guild_id)
+        return result
+
+    async def save_unregistered_members_bulk(self, guild_id: int, items: Iterable[Tuple[str, Dict, str]]):
+        """
+        Saves several unregistered members, given as (user_id, member_data, role_type) tuples, in one write.
+        They all live in the guild's single unregistered document, so one combined $set covers them.
+        """
+        update_data = {}
+        for user_id, member_data, role_type in items:
+            if role_type not in ["leaders", "members"]:
+                raise ValueError("role_type must be 'leaders' or 'members'")
+            update_data[f"{role_type}.{user_id}"] = member_data
+        if not update_data:
+            return None
+
+        result = await self._update_document(self.unregistered, {"guild_id": guild_id}, update_data, upsert=True)
+        self.invalidate_unregistered_cache(guild_id)
+        return result
 
     async def remove_unregistered_member(self, guild_id: int, user_id: str):
         """Removes a user from both unregistered leader and member lists in a single operation."""
-        return await self.unregistered.update_one(
+        result = await self.unregistered.update_one(
             {"guild_id": guild_id},
             {
                 "$unset": {f"leaders.{user_id}": "", f"members.{user_id}": ""},
-                "$set": {"updated_at": datetime.utcnow()}
+                "$currentDate": {"updated_at": True}
             }
         )
+        self.invalidate_unregistered_cache(guild_id)
+        return result
 
     async def move_unregistered_member_role(self, guild_id: int, user_id: str, from_type: str, to_type: str):
         """Atomically moves a member from one role type to another within the unregistered document."""
         if from_type not in ["leaders", "members"] or to_type not in ["leaders", "members"]:
             raise ValueError("role_type must be 'leaders' or 'members'")
 
-        unregistered_doc = await self.get_unregistered_document(guild_id)
-        if not unregistered_doc or user_id not in unregistered_doc.get(from_type, {}):
-            logger.warning(f"User {user_id} not found in unregistered '{from_type}' list for guild {guild_id}.")
+        # A pipeline update copies the entry across server-side, so there's no read round-trip and no race with other writers
+        result = await self.unregistered.update_one(
+            {"guild_id": guild_id, f"{from_type}.{user_id}": {"$exists": True}},
+            [
+                {"$set": {
+                    to_type: {"$mergeObjects": [f"${to_type}", {user_id: f"${from_type}.{user_id}"}]},
+                    "updated_at": "$$NOW"
+                }},
+                {"$unset": f"{from_type}.{user_id}"}
+            ]
+        )
+        if result.matched_count == 0:
+            logger.warning("User %s not found in unregistered '%s' list for guild %s.", user_id, from_type, guild_id)
             return False
 
-        member_data = unregistered_doc[from_type][user_id]
-
-        update_pipeline = {
-            "$set": {f"{to_type}.{user_id}": member_data, "updated_at": datetime.utcnow()},
-            "$unset": {f"{from_type}.{user_id}": ""}
-        }
-
-        result = await self.unregistered.update_one({"guild_id": guild_id}, update_pipeline)
+        self.invalidate_unregistered_cache(guild_id)
         return result.modified_count > 0
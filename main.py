@@ -1,3 +1,4 @@
+import asyncio
 import discord
 from discord.ext import commands
 import sys
@@ -33,6 +34,8 @@ bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
 
 # Initialize database with TeamDatabaseManager
 bot.db = TeamDatabaseManager(MONGO_URI, db_name=DB_NAME)
+# on_ready fires again after every reconnect; the one-time startup work must only run once
+bot._cogs_loaded = False
 
 async def load_cogs(bot, logger):
     """Load all cogs from the cogs directory, including subdirectories."""
@@ -42,61 +45,98 @@ async def load_cogs(bot, logger):
         os.makedirs(cogs_dir)
         return
 
+    # One directory scan; DirEntry caches the type, so there's no extra stat per entry
+    cog_names = []
+    with os.scandir(cogs_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # This is a subdirectory, look for a cog.py inside
+                if os.path.exists(os.path.join(entry.path, "cog.py")):
+                    cog_names.append(f"cogs.{entry.name}.cog")
+            elif entry.name.endswith(".py") and not entry.name.startswith("_"):
+                # This is a regular cog file
+                cog_names.append(f"cogs.{entry.name[:-3]}")
+
+    results = await asyncio.gather(*(bot.load_extension(name) for name in cog_names), return_exceptions=True)
+
     loaded_count = 0
     failed_count = 0
-
-    for item in os.listdir(cogs_dir):
-        path = os.path.join(cogs_dir, item)
-        if os.path.isdir(path):
-            # This is a subdirectory, look for a cog.py inside
-            cog_file = os.path.join(path, "cog.py")
-            if os.path.exists(cog_file):
-                cog_name = f"cogs.{item}.cog"
-                try:
-                    await bot.load_extension(cog_name)
-                    logger.info(f"Loaded cog: {cog_name}")
-                    loaded_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to load cog {cog_name}: {e}", exc_info=True)
-                    failed_count += 1
-        elif item.endswith(".py") and not item.startswith("_"):
-            # This is a regular cog file
-            cog_name = f"cogs.{item[:-3]}"
-            try:
-                await bot.load_extension(cog_name)
-                logger.info(f"Loaded cog: {cog_name}")
-                loaded_count += 1
-            except Exception as e:
-                logger.error(f"Failed to load cog {cog_name}: {e}", exc_info=True)
-                failed_count += 1
+    for cog_name, result in zip(cog_names, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to load cog {cog_name}: {result}", exc_info=result)
+            failed_count += 1
+        else:
+            logger.info(f"Loaded cog: {cog_name}")
+            loaded_count += 1
 
     print(f"Cog loading complete: {loaded_count} loaded, {failed_count} failed")
     print("Loaded cogs:", list(bot.cogs.keys()))
 
 
+# Guild join/leave bursts are coalesced into a single presence update after this many seconds
+PRESENCE_DEBOUNCE_SECONDS = 2.0
+_presence_task = None
+
+async def _refresh_presence(delay: float = PRESENCE_DEBOUNCE_SECONDS):
+    """Updates the 'watching N servers' status once the guild count has settled."""
+    await asyncio.sleep(delay)
+    try:
+        await bot.change_presence(
+            activity=discord.Activity(
+                type=discord.ActivityType.watching,
+                name=f"{len(bot.guilds)} servers | /help"
+            )
+        )
+    except Exception as e:
+        logger.error(f"Error updating presence: {e}")
+
+def _schedule_presence_refresh():
+    """(Re)starts the debounced presence update, cancelling one that hasn't fired yet."""
+    global _presence_task
+    if _presence_task is not None and not _presence_task.done():
+        _presence_task.cancel()
+    _presence_task = asyncio.create_task(_refresh_presence())
+
+
 @bot.event
 async def on_ready():
     try:
         logger.info(f"Bot logged in as {bot.user.name}#{bot.user.discriminator}")
         logger.info(f"Bot ID: {bot.user.id}")
 
+        if bot._cogs_loaded:
+            logger.info(f"Reconnected to {len(bot.guilds)} guilds")
+            _schedule_presence_refresh()
+            return
+
+        # Missing indexes only cost speed, so a failure here must not keep the cogs from loading
+        try:
+            await bot.db.ensure_indexes()
+        except Exception as e:
+            logger.error(f"Failed to ensure database indexes: {e}", exc_info=True)
+
         await load_cogs(bot, logger)
+        bot._cogs_loaded = True
         logger.info(f"Connected to {len(bot.guilds)} guilds")
 
-        synced_global = await bot.tree.sync()
-        logger.info(f"Synced {len(synced_global)} global commands")
+        # Command sync and panel restoration are independent once the cogs are loaded, so run them together
+        restoring_cogs = [cog for cog in bot.cogs.values() if hasattr(cog, 'restore_team_panels')]
+        synced_global, *restore_results = await asyncio.gather(
+            bot.tree.sync(),
+            *(cog.restore_team_panels() for cog in restoring_cogs),
+            return_exceptions=True
+        )
 
-        # Restore team panels
-        for cog in bot.cogs.values():
-            if hasattr(cog, 'restore_team_panels'):
-                await cog.restore_team_panels()
+        if isinstance(synced_global, BaseException):
+            logger.error(f"Failed to sync global commands: {synced_global}", exc_info=synced_global)
+        else:
+            logger.info(f"Synced {len(synced_global)} global commands")
 
-        await bot.change_presence(
-            activity=discord.Activity(
-                type=discord.ActivityType.watching,
-                name=f"{len(bot.guilds)} servers | /help"
-            )
-        )
+        for cog, result in zip(restoring_cogs, restore_results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to restore team panels for {cog.qualified_name}: {result}", exc_info=result)
+
+        _schedule_presence_refresh()
 
     except Exception as e:
         logger.error(f"Startup error: {e}", exc_info=True)
@@ -105,12 +145,7 @@ async def on_ready():
 async def on_guild_join(guild):
     try:
         logger.info(f"Joined new guild: {guild.name} (ID: {guild.id})")
-        await bot.change_presence(
-            activity=discord.Activity(
-                type=discord.ActivityType.watching,
-                name=f"{len(bot.guilds)} servers | /help"
-            )
-        )
+        _schedule_presence_refresh()
     except Exception as e:
         logger.error(f"Error handling guild join: {e}")
 
@@ -118,12 +153,7 @@ async def on_guild_join(guild):
 async def on_guild_remove(guild):
     try:
         logger.info(f"Left guild: {guild.name} (ID: {guild.id})")
-        await bot.change_presence(
-            activity=discord.Activity(
-                type=discord.ActivityType.watching,
-                name=f"{len(bot.guilds)} servers | /help"
-            )
-        )
+        _schedule_presence_refresh()
     except Exception as e:
         logger.error(f"Error handling guild leave: {e}")
 